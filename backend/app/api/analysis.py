@@ -1,28 +1,43 @@
 """
 Analysis API endpoints.
 """
+import asyncio
 import logging
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
 from decimal import Decimal
 
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.config import settings
 from app.db.database import get_async_session
 from app.models.models import UploadJob, AnalysisResult, ResourceCost, PricingVersion
 from app.terraform.service_mapping import get_service_code
+from app.terraform.evaluator.engine import TerraformEvaluationEngine
+from app.terraform.evaluator.errors import (
+    UnresolvedReferenceError,
+    ExpansionLimitExceededError,
+    InvalidExpressionError
+)
+from app.pricing.version_manager import VersionStatus, get_cached_active_version
 from app.engine.aggregator import CostAggregator
+from app.engine.async_calculator import AsyncCostCalculator
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-
+@lru_cache(maxsize=1024)
 def _get_service_code(resource_type: str) -> str:
-    """Get service code for resource type."""
+    """
+    Get service code for resource type.
+    
+    Memoized: unsupported types otherwise raise and catch a ValueError for
+    every resource of that type.
+    """
     try:
         return get_service_code(resource_type)
     except ValueError:
@@ -63,11 +78,8 @@ async def analyze_terraform(
         await db.commit()
         
         
-        # CRITICAL: Get ACTIVE pricing version using version manager
-        from app.pricing.version_manager import PricingVersionManager, VersionStatus
-        
-        version_manager = PricingVersionManager(db)
-        pricing_version = version_manager.get_active_version()
+        # CRITICAL: Get ACTIVE pricing version (cached, one query per TTL window)
+        pricing_version = await get_cached_active_version(db)
         
         if not pricing_version:
             raise HTTPException(
@@ -86,13 +98,6 @@ async def analyze_terraform(
         # CRITICAL: Use Terraform Semantic Evaluator (not regex-based parser)
         logger.info(f"Evaluating Terraform semantically for job {job_id}")
         
-        from app.terraform.evaluator.engine import TerraformEvaluationEngine
-        from app.terraform.evaluator.errors import (
-            UnresolvedReferenceError,
-            ExpansionLimitExceededError,
-            InvalidExpressionError
-        )
-        
         try:
             # Use semantic evaluator instead of old parser
             evaluator = TerraformEvaluationEngine(
@@ -110,10 +115,18 @@ async def analyze_terraform(
             # 5. Expand for_each
             # 6. Resolve all expressions
             # 7. FAIL HARD on unresolved references
+            #
+            # CRITICAL: HCL parsing and evaluation are blocking CPU work; run
+            # them in a worker thread so this request doesn't stall every
+            # other request on the event loop for the whole evaluation
             if file_path.is_file():
-                expanded_resources = evaluator.evaluate_terraform_file(file_path)
+                expanded_resources = await asyncio.to_thread(
+                    evaluator.evaluate_terraform_file, file_path
+                )
             else:
-                expanded_resources = evaluator.evaluate_terraform_directory(file_path)
+                expanded_resources = await asyncio.to_thread(
+                    evaluator.evaluate_terraform_directory, file_path
+                )
             
             logger.info(f"Evaluated {len(expanded_resources)} resources")
             
@@ -165,8 +178,6 @@ async def analyze_terraform(
         
         # Calculate costs (ASYNC - no blocking)
         logger.info("Calculating costs")
-        from app.engine.async_calculator import AsyncCostCalculator
-        
         calculator = AsyncCostCalculator(db, pricing_version)
         cost_results = await calculator.calculate_all_costs(normalized_resources)
         
@@ -196,26 +207,31 @@ async def analyze_terraform(
         db.add(analysis_result)
         await db.flush()
         
-        # Store individual resource costs with explicit status
-        for cost_result in cost_results:
-            resource_cost = ResourceCost(
-                analysis_id=analysis_result.id,
-                resource_type=cost_result.get("resource_type", "Unknown"),
-                resource_name=cost_result.get("resource_name", "Unknown"),
-                service_code=cost_result.get("service_code", "Unknown"),
-                region_code=cost_result.get("region"),
-                monthly_cost=Decimal(str(cost_result.get("monthly_cost", 0))),
-                attributes={
+        # Store individual resource costs with explicit status.
+        # One bulk INSERT (executemany) for every row instead of a tracked
+        # ORM object per resource: the rows are write-only here
+        resource_cost_rows = [
+            {
+                "analysis_id": analysis_result.id,
+                "resource_type": cost_result.get("resource_type", "Unknown"),
+                "resource_name": cost_result.get("resource_name", "Unknown"),
+                "service_code": cost_result.get("service_code", "Unknown"),
+                "region_code": cost_result.get("region"),
+                "monthly_cost": Decimal(str(cost_result.get("monthly_cost", 0))),
+                "attributes": {
                     "status": cost_result.get("status"),
                     "pricing_rule_id": cost_result.get("pricing_rule_id"),
                     "calculation_steps": cost_result.get("calculation_steps", []),
                     "error_message": cost_result.get("error_message"),
                     "unsupported_reason": cost_result.get("unsupported_reason")
                 },
-                pricing_details=cost_result.get("pricing_details", {}),
-                warnings=cost_result.get("warnings")
-            )
-            db.add(resource_cost)
+                "pricing_details": cost_result.get("pricing_details", {}),
+                "warnings": cost_result.get("warnings")
+            }
+            for cost_result in cost_results
+        ]
+        if resource_cost_rows:
+            await db.execute(insert(ResourceCost), resource_cost_rows)
         
         # Update job status
         upload_job.status = "completed"
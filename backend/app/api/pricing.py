@@ -2,8 +2,9 @@
 Pricing API endpoints.
 """
 import logging
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
@@ -15,6 +16,27 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Service catalog payload, built once per process. The catalog only changes
+# when pricing data is reloaded, which calls clear_pricing_services_cache().
+_services_cache: Optional[Dict[str, Any]] = None
+
+
+# Dimension count per pricing version id. Counting a version's dimensions
+# scans all of its rows, and a version's contents only change when pricing
+# data is reloaded, which calls clear_pricing_stats_cache().
+_dimension_counts: Dict[int, int] = {}
+
+
+def clear_pricing_services_cache() -> None:
+    """Drop the cached service catalog so the next request re-reads it."""
+    global _services_cache
+    _services_cache = None
+
+
+def clear_pricing_stats_cache() -> None:
+    """Drop cached per-version dimension counts."""
+    _dimension_counts.clear()
+
 
 @router.get("/pricing/versions")
 async def get_pricing_versions(
@@ -26,10 +48,17 @@ async def get_pricing_versions(
     Returns:
         List of pricing versions
     """
+    # Select only the listed columns: plain rows skip ORM instance
+    # construction and identity-map bookkeeping for every version
     result = await db.execute(
-        select(PricingVersion).order_by(PricingVersion.created_at.desc())
+        select(
+            PricingVersion.id,
+            PricingVersion.version,
+            PricingVersion.is_active,
+            PricingVersion.created_at,
+            PricingVersion.source
+        ).order_by(PricingVersion.created_at.desc())
     )
-    versions = result.scalars().all()
     
     return {
         "versions": [
@@ -40,7 +69,7 @@ async def get_pricing_versions(
                 "created_at": v.created_at.isoformat(),
                 "source": v.source
             }
-            for v in versions
+            for v in result
         ]
     }
 
@@ -55,12 +84,17 @@ async def get_pricing_services(
     Returns:
         List of supported services
     """
+    global _services_cache
+    
+    if _services_cache is not None:
+        return _services_cache
+    
     result = await db.execute(
         select(PricingService).order_by(PricingService.service_name)
     )
     services = result.scalars().all()
     
-    return {
+    payload = {
         "services": [
             {
                 "code": s.service_code,
@@ -70,6 +104,12 @@ async def get_pricing_services(
             for s in services
         ]
     }
+    
+    # Don't pin an empty catalog from before the services table was seeded
+    if services:
+        _services_cache = payload
+    
+    return payload
 
 
 @router.get("/pricing/stats")
@@ -82,11 +122,33 @@ async def get_pricing_stats(
     Returns:
         Pricing data statistics
     """
-    # Get active version
-    active_version_result = await db.execute(
-        select(PricingVersion).where(PricingVersion.is_active == True)
-    )
-    active_version = active_version_result.scalar_one_or_none()
+    active_version = None
+    cached = False
+    
+    # Warm cache: only the cheap active-version lookup runs per request
+    if _dimension_counts:
+        result = await db.execute(
+            select(PricingVersion).where(PricingVersion.is_active == True)
+        )
+        active_version = result.scalar_one_or_none()
+        cached = active_version is None or active_version.id in _dimension_counts
+    
+    if cached:
+        total_dimensions = _dimension_counts.get(active_version.id) if active_version else 0
+    else:
+        # Cold cache (or a newly activated version): active version and its
+        # dimension count in one round trip (outer join keeps a version that
+        # has no dimensions yet); the full count then runs once per version
+        result = await db.execute(
+            select(PricingVersion, func.count(PricingDimension.id))
+            .outerjoin(PricingDimension, PricingDimension.version_id == PricingVersion.id)
+            .where(PricingVersion.is_active == True)
+            .group_by(PricingVersion.id)
+        )
+        row = result.one_or_none()
+        active_version, total_dimensions = row if row else (None, 0)
+        if active_version:
+            _dimension_counts[active_version.id] = total_dimensions
     
     if not active_version:
         return {
@@ -95,13 +157,6 @@ async def get_pricing_stats(
             "message": "No active pricing version. Run pricing ingestion."
         }
     
-    # Count dimensions
-    count_result = await db.execute(
-        select(func.count(PricingDimension.id))
-        .where(PricingDimension.version_id == active_version.id)
-    )
-    total_dimensions = count_result.scalar()
-    
     return {
         "active_version": active_version.version,
         "version_created": active_version.created_at.isoformat(),
@@ -111,15 +166,22 @@ async def get_pricing_stats(
 
 
 @router.post("/pricing/update")
-async def trigger_pricing_update():
+async def trigger_pricing_update(background_tasks: BackgroundTasks):
     """
     Manually trigger pricing update.
     
+    The update runs as a background task after the response is sent. Sync
+    background tasks run in a worker thread, so the job's asyncio.run()
+    gets its own event loop instead of colliding with the server's.
+    
+    Args:
+        background_tasks: Request background task queue
+    
     Returns:
         Update status
     """
     try:
-        pricing_scheduler.run_now()
+        background_tasks.add_task(pricing_scheduler.run_now)
         return {
             "status": "started",
             "message": "Pricing update started. This may take 30-60 minutes."
@@ -1,6 +1,7 @@
 """
 Upload API endpoints with secure file handling.
 """
+import asyncio
 import logging
 import shutil
 import uuid
@@ -58,13 +59,15 @@ async def upload_terraform(
     
     try:
         if is_zip:
-            # Save zip temporarily
+            # Save zip temporarily. Disk writes and extraction are blocking;
+            # run them in a worker thread to keep the event loop serving
             zip_path = job_dir / filename
-            zip_path.write_bytes(content)
+            await asyncio.to_thread(zip_path.write_bytes, content)
             
             # Extract safely with validation
             try:
-                extracted_files = FileValidator.safe_extract_zip(
+                extracted_files = await asyncio.to_thread(
+                    FileValidator.safe_extract_zip,
                     str(zip_path),
                     str(job_dir)
                 )
@@ -91,7 +94,7 @@ async def upload_terraform(
             
             # Save single file
             file_path = job_dir / filename
-            file_path.write_bytes(content)
+            await asyncio.to_thread(file_path.write_bytes, content)
             
             # Validate file size
             try:
@@ -111,12 +114,13 @@ async def upload_terraform(
             upload_type=upload_type,
             file_path=file_path,
             status="pending",
-            metadata={"filename": filename}
+            metadata_={"filename": filename}
         )
         
+        # No refresh after commit: the response only needs the client-side
+        # job_id, so re-reading the row would be a wasted round trip
         db.add(upload_job)
         await db.commit()
-        await db.refresh(upload_job)
         
         logger.info(f"Created upload job: {job_id}")
         
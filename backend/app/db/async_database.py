@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.db.serialization import json_deserializer, json_serializer
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,8 @@ async def init_async_db() -> None:
         pool_pre_ping=True,
         pool_size=20,
         max_overflow=10,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
         # Use NullPool for background tasks to avoid connection issues
         poolclass=NullPool if settings.app_env == "test" else None
     )
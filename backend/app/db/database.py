@@ -8,6 +8,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.db.serialization import json_deserializer, json_serializer
 
 # Create async engine
 async_engine = create_async_engine(
@@ -16,6 +17,8 @@ async_engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 # Create sync engine for migrations and background jobs
@@ -25,6 +28,8 @@ sync_engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 # Create async session factory
@@ -0,0 +1,34 @@
+"""
+JSON column serialization for SQLAlchemy engines.
+"""
+from typing import Any, Union
+
+import orjson
+
+
+def json_serializer(value: Any) -> str:
+    """
+    Serialize JSON columns with orjson (attributes, calculation steps).
+    
+    OPT_NON_STR_KEYS keeps stdlib json's handling of int dictionary keys.
+    
+    Args:
+        value: JSON-compatible value
+    
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_deserializer(value: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON columns with orjson.
+    
+    Args:
+        value: JSON text from the driver
+    
+    Returns:
+        Parsed JSON value
+    """
+    return orjson.loads(value)
@@ -5,7 +5,8 @@ NO inference from monthly_cost amount.
 import logging
 from typing import Dict, List
 from decimal import Decimal
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import chain
 
 logger = logging.getLogger(__name__)
 
@@ -106,16 +107,14 @@ class CostAggregator:
         Returns:
             Dictionary with total, supported, unsupported, and error counts
         """
-        total = len(self.cost_results)
-        supported = sum(1 for r in self.cost_results if r.get("status") == "SUPPORTED")
-        unsupported = sum(1 for r in self.cost_results if r.get("status") == "UNSUPPORTED")
-        errors = sum(1 for r in self.cost_results if r.get("status") == "ERROR")
+        # One counting pass over the results instead of one scan per status
+        status_counts = Counter(r.get("status") for r in self.cost_results)
         
         return {
-            "total": total,
-            "supported": supported,
-            "unsupported": unsupported,
-            "error": errors
+            "total": len(self.cost_results),
+            "supported": status_counts["SUPPORTED"],
+            "unsupported": status_counts["UNSUPPORTED"],
+            "error": status_counts["ERROR"]
         }
     
     def get_coverage_percentage(self) -> float:
@@ -138,21 +137,23 @@ class CostAggregator:
         Returns:
             List of unique warnings
         """
-        warnings = set()
-        
-        for result in self.cost_results:
-            result_warnings = result.get("warnings", [])
-            warnings.update(result_warnings)
+        # dict.fromkeys dedups in a single C-level pass and keeps the
+        # order warnings were first raised in (set() would scramble it)
+        warnings = list(dict.fromkeys(chain.from_iterable(
+            result.get("warnings", []) for result in self.cost_results
+        )))
         
         # Add coverage warning if incomplete
         coverage = self.get_coverage_percentage()
         if coverage < 100.0:
-            warnings.add(
+            coverage_warning = (
                 f"Pricing coverage: {coverage:.1f}% - "
                 f"some resources excluded from totals"
             )
+            if coverage_warning not in warnings:
+                warnings.append(coverage_warning)
         
-        return list(warnings)
+        return warnings
     
     def collect_errors(self) -> List[Dict]:
         """
@@ -198,20 +199,68 @@ class CostAggregator:
         """
         Perform all aggregations with explicit status handling.
         
+        Fuses every per-status aggregation into ONE pass over the results
+        (the individual methods above each walk the full list).
+        
         Returns:
             Complete aggregation result
         """
-        counts = self.get_resource_counts()
-        coverage = self.get_coverage_percentage()
+        total_cost = 0.0
+        service_costs = defaultdict(float)
+        region_costs = defaultdict(float)
+        type_costs = defaultdict(float)
+        counts = {"total": len(self.cost_results), "supported": 0, "unsupported": 0, "error": 0}
+        warnings = {}
+        errors = []
+        unsupported = []
+        
+        for result in self.cost_results:
+            warnings.update(dict.fromkeys(result.get("warnings", [])))
+            
+            status = result.get("status")
+            
+            # CRITICAL: Only SUPPORTED resources contribute to totals
+            if status == "SUPPORTED":
+                counts["supported"] += 1
+                cost = result.get("monthly_cost", 0.0)
+                total_cost += cost
+                service_costs[result.get("service_code", "Unknown")] += cost
+                region_costs[result.get("region", "Unknown")] += cost
+                type_costs[result.get("resource_type", "Unknown")] += cost
+            
+            elif status == "UNSUPPORTED":
+                counts["unsupported"] += 1
+                unsupported.append({
+                    "resource": result.get("resource_name"),
+                    "type": result.get("resource_type"),
+                    "reason": result.get("unsupported_reason", "Unknown reason")
+                })
+            
+            elif status == "ERROR":
+                counts["error"] += 1
+                errors.append({
+                    "resource": result.get("resource_name"),
+                    "type": result.get("resource_type"),
+                    "error": result.get("error_message", "Unknown error")
+                })
+        
+        coverage = (counts["supported"] / counts["total"]) * 100.0 if counts["total"] else 0.0
+        
+        # Add coverage warning if incomplete
+        if coverage < 100.0:
+            warnings[
+                f"Pricing coverage: {coverage:.1f}% - "
+                f"some resources excluded from totals"
+            ] = None
         
         return {
-            "total_monthly_cost": self.get_total_cost(),
-            "breakdown_by_service": self.aggregate_by_service(),
-            "breakdown_by_region": self.aggregate_by_region(),
-            "breakdown_by_type": self.aggregate_by_resource_type(),
+            "total_monthly_cost": total_cost,
+            "breakdown_by_service": dict(service_costs),
+            "breakdown_by_region": dict(region_costs),
+            "breakdown_by_type": dict(type_costs),
             "resource_counts": counts,
             "coverage_percentage": coverage,
-            "warnings": self.collect_warnings(),
-            "errors": self.collect_errors(),
-            "unsupported": self.collect_unsupported()
+            "warnings": list(warnings),
+            "errors": errors,
+            "unsupported": unsupported
         }
@@ -24,7 +24,7 @@ class ResourceStatus(str, Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceCostResult:
     """
     Cost result for a single resource with explicit status.
@@ -195,41 +195,38 @@ class CostAggregator:
         Returns:
             CostAnalytics with complete breakdown
         """
-        # Separate by status
-        supported = [r for r in self.resource_results if r.status == ResourceStatus.SUPPORTED]
-        unsupported = [r for r in self.resource_results if r.status == ResourceStatus.UNSUPPORTED]
-        errors = [r for r in self.resource_results if r.status == ResourceStatus.ERROR]
+        # Separate by status in one pass (instead of one scan per status)
+        by_status = {status: [] for status in ResourceStatus}
+        for r in self.resource_results:
+            bucket = by_status.get(r.status)
+            if bucket is not None:
+                bucket.append(r)
+        
+        supported = by_status[ResourceStatus.SUPPORTED]
+        unsupported = by_status[ResourceStatus.UNSUPPORTED]
+        errors = by_status[ResourceStatus.ERROR]
         
         logger.info(
             f"Aggregating: {len(supported)} supported, "
             f"{len(unsupported)} unsupported, {len(errors)} errors"
         )
         
-        # Calculate total (SUPPORTED only)
-        total_cost = sum(r.monthly_cost for r in supported)
-        
-        # Aggregate by service (SUPPORTED only)
+        # Total and breakdowns by service, region and resource type
+        # (SUPPORTED only), accumulated in a single pass
+        total_cost = Decimal("0")
         cost_by_service = {}
-        for r in supported:
-            if r.service_code:
-                cost_by_service[r.service_code] = (
-                    cost_by_service.get(r.service_code, Decimal("0")) + r.monthly_cost
-                )
-        
-        # Aggregate by region (SUPPORTED only)
         cost_by_region = {}
-        for r in supported:
-            if r.region:
-                cost_by_region[r.region] = (
-                    cost_by_region.get(r.region, Decimal("0")) + r.monthly_cost
-                )
-        
-        # Aggregate by resource type (SUPPORTED only)
         cost_by_type = {}
+        zero = Decimal("0")
+        
         for r in supported:
-            cost_by_type[r.resource_type] = (
-                cost_by_type.get(r.resource_type, Decimal("0")) + r.monthly_cost
-            )
+            cost = r.monthly_cost
+            total_cost += cost
+            if r.service_code:
+                cost_by_service[r.service_code] = cost_by_service.get(r.service_code, zero) + cost
+            if r.region:
+                cost_by_region[r.region] = cost_by_region.get(r.region, zero) + cost
+            cost_by_type[r.resource_type] = cost_by_type.get(r.resource_type, zero) + cost
         
         # Calculate coverage
         total_resources = len(self.resource_results)
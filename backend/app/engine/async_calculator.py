@@ -33,21 +33,15 @@ class AsyncCostCalculator:
         Returns:
             Cost result with status, monthly_cost, pricing_details
         """
+        # Unsupported services short-circuit without touching the matcher
+        if resource.get("service") not in AsyncServiceMatcher.SUPPORTED_SERVICES:
+            return self._unsupported_result(resource)
+        
         # Get adapter for this resource
         adapter = await self.matcher.match_resource_async(resource)
         
         if not adapter:
-            # CRITICAL: Explicit UNSUPPORTED status
-            return {
-                "status": "UNSUPPORTED",
-                "resource_type": resource.get("resource_type"),
-                "resource_name": resource.get("name"),
-                "service_code": resource.get("service"),
-                "region": resource.get("region"),
-                "monthly_cost": 0.0,
-                "unsupported_reason": f"No adapter available for service: {resource.get('service')}",
-                "warnings": []
-            }
+            return self._unsupported_result(resource)
         
         # Calculate cost using adapter
         try:
@@ -99,6 +93,58 @@ class AsyncCostCalculator:
                 "warnings": []
             }
     
+    def _unsupported_result(self, resource: Dict) -> Dict:
+        """
+        Build the zero-cost result for a resource without an adapter.
+        
+        Args:
+            resource: Normalized resource
+        
+        Returns:
+            Cost result with UNSUPPORTED status
+        """
+        # CRITICAL: Explicit UNSUPPORTED status
+        return {
+            "status": "UNSUPPORTED",
+            "resource_type": resource.get("resource_type"),
+            "resource_name": resource.get("name"),
+            "service_code": resource.get("service"),
+            "region": resource.get("region"),
+            "monthly_cost": 0.0,
+            "unsupported_reason": f"No adapter available for service: {resource.get('service')}",
+            "warnings": []
+        }
+    
+    async def _prefetch_pricing(self, resources: List[Dict]) -> None:
+        """
+        Let each adapter batch-match pricing for its resources up front.
+        
+        Prefetching is an optimization only: if a service's batch fails, its
+        resources fall back to per-resource match_pricing, which reports
+        ERROR for each resource it cannot price.
+        
+        Args:
+            resources: List of normalized resources
+        """
+        by_service: Dict[str, List[Dict]] = {}
+        for resource in resources:
+            service = resource.get("service")
+            if service in AsyncServiceMatcher.SUPPORTED_SERVICES:
+                by_service.setdefault(service, []).append(resource.get("attributes", {}))
+        
+        for service, attributes in by_service.items():
+            try:
+                adapter = await self.matcher.get_adapter(service)
+                # CRITICAL: Savepoint, so a failed batch query does not abort
+                # the transaction the per-resource fallback still needs
+                async with self.db.begin_nested():
+                    await adapter.prefetch_pricing(attributes)
+            except Exception as e:
+                logger.warning(
+                    f"Pricing prefetch failed for {service}, matching per resource: {e}",
+                    exc_info=True
+                )
+    
     async def calculate_all_costs(self, resources: List[Dict]) -> List[Dict]:
         """
         Calculate costs for all resources.
@@ -109,6 +155,8 @@ class AsyncCostCalculator:
         Returns:
             List of cost results with explicit status
         """
+        await self._prefetch_pricing(resources)
+        
         results = []
         
         for resource in resources:
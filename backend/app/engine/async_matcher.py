@@ -31,6 +31,9 @@ class AsyncServiceMatcher:
         "AWSLambda": AsyncLambdaAdapterNormalized,
     }
     
+    # Precomputed for O(1) unsupported-service checks on the hot path
+    SUPPORTED_SERVICES = frozenset(ADAPTER_MAP)
+    
     def __init__(self, db: AsyncSession, pricing_version: PricingVersion):
         self.db = db
         self.pricing_version = pricing_version
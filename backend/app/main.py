@@ -5,6 +5,7 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
@@ -48,7 +49,9 @@ app = FastAPI(
     title="AWS Terraform Cost Calculator",
     description="Calculate AWS costs from Terraform files",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes large cost breakdowns several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
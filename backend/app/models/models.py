@@ -8,7 +8,7 @@ from sqlalchemy import (
     Boolean, Column, Integer, String, Text, Numeric, DateTime,
     ForeignKey, CheckConstraint, Index, UniqueConstraint, JSON
 )
-from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -28,7 +28,22 @@ class PricingVersion(Base):
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     is_active = Column(Boolean, nullable=False, default=False)
     source = Column(String(100), nullable=False)
-    metadata = Column(JSONB)
+    # "metadata" is reserved on declarative classes; the column keeps its name
+    metadata_ = Column("metadata", JSONB)
+    
+    # Lifecycle state (migration 002); the enum type is created by the migration
+    status = Column(
+        ENUM("DRAFT", "VALIDATED", "ACTIVE", "ARCHIVED", name="pricing_version_status", create_type=False),
+        nullable=False,
+        default="DRAFT"
+    )
+    validated_at = Column(DateTime)
+    validated_by = Column(String(255))
+    validation_errors = Column(JSONB)
+    activated_at = Column(DateTime)
+    activated_by = Column(String(255))
+    archived_at = Column(DateTime)
+    archived_by = Column(String(255))
     
     # Relationships
     dimensions = relationship("PricingDimension", back_populates="version", cascade="all, delete-orphan")
@@ -183,7 +198,7 @@ class UploadJob(Base):
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     completed_at = Column(DateTime)
     error_message = Column(Text)
-    metadata = Column(JSONB)
+    metadata_ = Column("metadata", JSONB)
     
     # Relationships
     analysis_result = relationship("AnalysisResult", back_populates="upload_job", uselist=False)
@@ -271,7 +286,7 @@ class PricingIngestionLog(Base):
     error_message = Column(Text)
     started_at = Column(DateTime, nullable=False, server_default=func.now())
     completed_at = Column(DateTime)
-    metadata = Column(JSONB)
+    metadata_ = Column("metadata", JSONB)
     
     __table_args__ = (
         CheckConstraint("status IN ('started', 'completed', 'failed')", name="check_log_status"),
@@ -7,6 +7,12 @@ from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, Field
 
+# Fixed hour counts, built once instead of on every get_effective_hours call
+_ALWAYS_ON_HOURS = Decimal("730")  # 24 * 365.25 / 12
+_BUSINESS_HOURS = Decimal("176")   # 8 hours/day * 22 business days/month
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+
 
 class UsagePattern(str, Enum):
     """Supported usage patterns."""
@@ -55,11 +61,10 @@ class UsageModel(BaseModel):
             ValueError: If pattern requires additional parameters
         """
         if self.pattern == UsagePattern.ALWAYS_ON:
-            return Decimal("730")  # 24 * 365.25 / 12
+            return _ALWAYS_ON_HOURS
         
         elif self.pattern == UsagePattern.BUSINESS_HOURS:
-            # 8 hours/day * 22 business days/month
-            return Decimal("176")
+            return _BUSINESS_HOURS
         
         elif self.pattern == UsagePattern.PARTIAL:
             if self.hours_per_month is None:
@@ -69,15 +74,14 @@ class UsageModel(BaseModel):
             return self.hours_per_month
         
         elif self.pattern == UsagePattern.SPOT:
-            base_hours = Decimal("730")
             if self.interruption_factor is not None:
                 # Reduce hours by interruption factor
-                return base_hours * (Decimal("1") - self.interruption_factor)
-            return base_hours
+                return _ALWAYS_ON_HOURS * (_ONE - self.interruption_factor)
+            return _ALWAYS_ON_HOURS
         
         elif self.pattern == UsagePattern.LAMBDA:
             # Lambda doesn't use hours - return 0
-            return Decimal("0")
+            return _ZERO
         
         else:
             raise ValueError(f"Unknown usage pattern: {self.pattern}")
@@ -37,7 +37,7 @@ class FreeTierStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationStep:
     """
     Single step in cost calculation.
@@ -60,7 +60,7 @@ class CalculationStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CostResult:
     """
     Mandatory cost calculation result.
@@ -117,7 +117,7 @@ class CostResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingRule:
     """
     Matched pricing rule from database.
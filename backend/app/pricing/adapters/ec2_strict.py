@@ -19,10 +19,13 @@ from app.pricing.adapters.base import (
     CalculationError,
     UnitMismatchError
 )
-from app.models.models import PricingDimension, PricingVersion
+from app.models.models import PricingDimension, PricingRegion, PricingService, PricingVersion
 
 logger = logging.getLogger(__name__)
 
+# Hours in a standard month (365 days / 12 months * 24 hours), built once
+_HOURS_PER_MONTH = Decimal("730")
+
 
 class StrictEC2Adapter(PricingAdapter):
     """
@@ -95,14 +98,22 @@ class StrictEC2Adapter(PricingAdapter):
         tenancy = resource.get("tenancy", "Shared")
         operating_system = resource.get("operating_system", "Linux")
         
-        # Query pricing database
-        query = select(PricingDimension).where(
+        # Query pricing database (JSONB @> containment uses the GIN index).
+        # Dimensions reference services and regions by id, so codes are
+        # matched through their lookup tables.
+        query = select(PricingDimension).join(
+            PricingService, PricingDimension.service_id == PricingService.id
+        ).join(
+            PricingRegion, PricingDimension.region_id == PricingRegion.id
+        ).where(
             PricingDimension.version_id == self.pricing_version.id,
-            PricingDimension.service_code == "AmazonEC2",
-            PricingDimension.region_code == region,
-            PricingDimension.attributes["instanceType"].astext == instance_type,
-            PricingDimension.attributes["tenancy"].astext == tenancy,
-            PricingDimension.attributes["operatingSystem"].astext == operating_system
+            PricingService.service_code == self.service_code,
+            PricingRegion.region_code == region,
+            PricingDimension.attributes.contains({
+                "instanceType": instance_type,
+                "tenancy": tenancy,
+                "operatingSystem": operating_system
+            })
         )
         
         result = self.db.execute(query).scalar_one_or_none()
@@ -117,8 +128,8 @@ class StrictEC2Adapter(PricingAdapter):
         # Convert to PricingRule
         pricing_rule = PricingRule(
             id=result.id,
-            service_code=result.service_code,
-            region_code=result.region_code,
+            service_code=self.service_code,
+            region_code=region,
             price_per_unit=result.price_per_unit,
             unit=result.unit,
             currency=result.currency,
@@ -142,7 +153,7 @@ class StrictEC2Adapter(PricingAdapter):
         
         # Extract values
         hourly_rate = pricing_rule.price_per_unit
-        hours_per_month = Decimal("730")  # Standard month
+        hours_per_month = _HOURS_PER_MONTH
         
         # Build calculation steps
         steps = []
@@ -10,6 +10,15 @@ from app.pricing.adapters.base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
+# Unit conversions and free tier (1M requests and 400,000 GB-seconds per month),
+# built once instead of on every calculate_cost call
+_ZERO = Decimal("0")
+_ONE_MILLION = Decimal("1000000")
+_MB_PER_GB = Decimal("1024")
+_MS_PER_SECOND = Decimal("1000")
+FREE_TIER_REQUESTS = Decimal("1000000")
+FREE_TIER_GB_SECONDS = Decimal("400000")
+
 
 class LambdaAdapter(BaseAdapter):
     """Lambda function pricing adapter."""
@@ -45,11 +54,11 @@ class LambdaAdapter(BaseAdapter):
             }
         )
         
-        request_cost = Decimal("0")
+        request_cost = _ZERO
         if request_pricing:
             # Pricing is per 1M requests
             price_per_million = request_pricing.price_per_unit
-            request_cost = (Decimal(str(estimated_invocations)) / Decimal("1000000")) * price_per_million
+            request_cost = (Decimal(str(estimated_invocations)) / _ONE_MILLION) * price_per_million
         else:
             warnings.append("No request pricing found")
         
@@ -62,11 +71,11 @@ class LambdaAdapter(BaseAdapter):
             }
         )
         
-        duration_cost = Decimal("0")
+        duration_cost = _ZERO
         if duration_pricing:
             # Convert to GB-seconds
-            gb = Decimal(str(memory_size)) / Decimal("1024")  # MB to GB
-            seconds = Decimal(str(estimated_duration_ms)) / Decimal("1000")  # ms to seconds
+            gb = Decimal(str(memory_size)) / _MB_PER_GB  # MB to GB
+            seconds = Decimal(str(estimated_duration_ms)) / _MS_PER_SECOND  # ms to seconds
             gb_seconds_per_invocation = gb * seconds
             total_gb_seconds = gb_seconds_per_invocation * Decimal(str(estimated_invocations))
             
@@ -77,12 +86,8 @@ class LambdaAdapter(BaseAdapter):
             warnings.append("No duration pricing found")
         
         # Apply free tier (1M requests and 400,000 GB-seconds per month)
-        free_tier_requests = Decimal("1000000")
-        free_tier_gb_seconds = Decimal("400000")
-        
-        # Adjust for free tier
-        if estimated_invocations <= free_tier_requests:
-            request_cost = Decimal("0")
+        if estimated_invocations <= FREE_TIER_REQUESTS:
+            request_cost = _ZERO
             warnings.append("Within free tier for requests")
         
         # Total cost
@@ -10,6 +10,19 @@ from app.pricing.adapters.base import BaseAdapter
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+_REQUESTS_PER_PRICE_UNIT = Decimal("1000")
+
+# Terraform storage class -> AWS pricing storageClass attribute
+STORAGE_CLASS_MAP = {
+    "STANDARD": "General Purpose",
+    "STANDARD_IA": "Infrequent Access",
+    "ONEZONE_IA": "One Zone - Infrequent Access",
+    "GLACIER": "Archive",
+    "DEEP_ARCHIVE": "Deep Archive",
+    "INTELLIGENT_TIERING": "Intelligent-Tiering"
+}
+
 
 class S3Adapter(BaseAdapter):
     """S3 bucket pricing adapter."""
@@ -37,16 +50,7 @@ class S3Adapter(BaseAdapter):
         estimated_requests = resource.get("estimated_requests", 10000)
         
         # Map storage class names
-        storage_class_map = {
-            "STANDARD": "General Purpose",
-            "STANDARD_IA": "Infrequent Access",
-            "ONEZONE_IA": "One Zone - Infrequent Access",
-            "GLACIER": "Archive",
-            "DEEP_ARCHIVE": "Deep Archive",
-            "INTELLIGENT_TIERING": "Intelligent-Tiering"
-        }
-        
-        storage_class_name = storage_class_map.get(storage_class, "General Purpose")
+        storage_class_name = STORAGE_CLASS_MAP.get(storage_class, "General Purpose")
         
         # Calculate storage cost
         storage_pricing = self.query_pricing(
@@ -58,7 +62,7 @@ class S3Adapter(BaseAdapter):
             }
         )
         
-        storage_cost = Decimal("0")
+        storage_cost = _ZERO
         if storage_pricing:
             price_per_gb = storage_pricing.price_per_unit
             storage_cost = price_per_gb * Decimal(str(estimated_storage_gb))
@@ -74,11 +78,11 @@ class S3Adapter(BaseAdapter):
             }
         )
         
-        request_cost = Decimal("0")
+        request_cost = _ZERO
         if request_pricing:
             # Pricing is typically per 1000 requests
             price_per_1000 = request_pricing.price_per_unit
-            request_cost = (Decimal(str(estimated_requests)) / Decimal("1000")) * price_per_1000
+            request_cost = (Decimal(str(estimated_requests)) / _REQUESTS_PER_PRICE_UNIT) * price_per_1000
         else:
             warnings.append("No request pricing found")
         
@@ -3,9 +3,12 @@ Async pricing adapter base class.
 All pricing queries are async to eliminate blocking DB calls.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.sql.elements import TextClause
 
 from app.pricing.adapters.base import (
     PricingAdapter,
@@ -14,7 +17,54 @@ from app.pricing.adapters.base import (
     ValidationError,
     PricingMatchError
 )
-from app.models.models import PricingDimension, PricingVersion
+from app.models.models import PricingDimension, PricingRegion, PricingService, PricingVersion
+
+# Regions covered by the normalized pricing tables (shared by all normalized
+# adapters). The frozenset gives O(1) membership checks during validation.
+NORMALIZED_SUPPORTED_REGIONS: List[str] = [
+    "us-east-1", "us-east-2", "us-west-1", "us-west-2",
+    "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
+    "ap-south-1", "ap-southeast-1", "ap-southeast-2",
+    "ap-northeast-1", "ap-northeast-2", "ap-northeast-3",
+    "ca-central-1", "sa-east-1"
+]
+NORMALIZED_SUPPORTED_REGION_SET = frozenset(NORMALIZED_SUPPORTED_REGIONS)
+
+# Process-wide cache of matched pricing rules.
+# Adapters are created per request (they hold the request's session), so the
+# cache lives at module level and is shared by every adapter instance.
+# CRITICAL: Keys always include the pricing version id. Versions are immutable
+# once ingested, so a cached rule can never go stale for its version.
+PRICING_RULE_CACHE_SIZE = 1024
+_pricing_rule_cache: "OrderedDict[Tuple, PricingRule]" = OrderedDict()
+
+
+@lru_cache(maxsize=16)
+def _build_prefetch_query(table: str, key_columns: Tuple[str, ...]) -> TextClause:
+    """
+    Build (once per table) the batch pricing lookup used by prefetch.
+    
+    Every key column is filtered with an expanding IN list. The cross product
+    of those lists may over-select; callers keep only the rows they asked for.
+    
+    Args:
+        table: Normalized pricing table
+        key_columns: Lookup columns (all but version_id)
+    
+    Returns:
+        Text clause with :version_id and one expanding bind per key column
+    """
+    filters = "".join(f" AND {col} IN :{col}" for col in key_columns)
+    
+    return text(
+        f"SELECT id, sku, price_per_unit, unit, 'USD' as currency, {', '.join(key_columns)} "
+        f"FROM {table} WHERE version_id = :version_id{filters}"
+    ).bindparams(*(bindparam(col, expanding=True) for col in key_columns))
+
+
+def clear_pricing_rule_cache() -> None:
+    """Drop all cached pricing rules (e.g. after a version is re-ingested)."""
+    _pricing_rule_cache.clear()
 
 
 class AsyncPricingAdapter(ABC):
@@ -97,6 +147,20 @@ class AsyncPricingAdapter(ABC):
         """
         pass
     
+    async def prefetch_pricing(self, resources: List[Dict[str, Any]]) -> None:
+        """
+        Match pricing for many resources up front, filling the rule cache.
+        
+        Adapters that can resolve many lookups in one query override this;
+        the default does nothing and each match_pricing call queries alone.
+        Lookups the prefetch cannot satisfy are left to match_pricing, which
+        still raises PricingMatchError for them.
+        
+        Args:
+            resources: Resource attribute dicts about to be priced
+        """
+        return None
+    
     async def calculate_cost(self, resource: Dict[str, Any]) -> CostResult:
         """
         Complete async cost calculation pipeline.
@@ -122,6 +186,52 @@ class AsyncPricingAdapter(ABC):
         
         return cost_result
     
+    def _pricing_cache_key(self, params: Dict[str, Any]) -> Tuple:
+        """
+        Build the process-wide cache key for a pricing lookup.
+        
+        Args:
+            params: Query parameters (must include version_id)
+        
+        Returns:
+            Hashable cache key scoped to this adapter's service
+        """
+        return (self.service_code, tuple(sorted(params.items())))
+    
+    def _get_cached_pricing_rule(self, params: Dict[str, Any]) -> Optional[PricingRule]:
+        """
+        Look up a previously matched pricing rule.
+        
+        Args:
+            params: Query parameters (must include version_id)
+        
+        Returns:
+            Cached PricingRule or None on miss
+        """
+        key = self._pricing_cache_key(params)
+        rule = _pricing_rule_cache.get(key)
+        if rule is not None:
+            _pricing_rule_cache.move_to_end(key)
+        return rule
+    
+    def _cache_pricing_rule(self, params: Dict[str, Any], rule: PricingRule) -> PricingRule:
+        """
+        Store a matched pricing rule, evicting the least recently used entry.
+        
+        Only successful matches are cached; misses always hit the database.
+        
+        Args:
+            params: Query parameters (must include version_id)
+            rule: Matched pricing rule
+        
+        Returns:
+            The same pricing rule
+        """
+        _pricing_rule_cache[self._pricing_cache_key(params)] = rule
+        if len(_pricing_rule_cache) > PRICING_RULE_CACHE_SIZE:
+            _pricing_rule_cache.popitem(last=False)
+        return rule
+    
     async def _query_pricing_dimension(
         self,
         service_code: str,
@@ -142,16 +252,25 @@ class AsyncPricingAdapter(ABC):
         Raises:
             PricingMatchError: If no match found
         """
-        query = select(PricingDimension).where(
+        # Dimensions reference services and regions by id
+        query = select(PricingDimension).join(
+            PricingService, PricingDimension.service_id == PricingService.id
+        ).join(
+            PricingRegion, PricingDimension.region_id == PricingRegion.id
+        ).where(
             PricingDimension.version_id == self.pricing_version.id,
-            PricingDimension.service_code == service_code,
-            PricingDimension.region_code == region_code
+            PricingService.service_code == service_code,
+            PricingRegion.region_code == region_code
         )
         
-        # Add attribute filters
-        for key, value in filters.items():
+        # Add attribute filters as ONE JSONB containment (@>) predicate.
+        # Unlike per-key ->> equality, @> is served by the GIN index
+        # idx_pricing_dimensions_attributes instead of a row-by-row scan.
+        if filters:
             query = query.where(
-                PricingDimension.attributes[key].astext == str(value)
+                PricingDimension.attributes.contains(
+                    {key: str(value) for key, value in filters.items()}
+                )
             )
         
         result = await self.db.execute(query)
@@ -163,3 +282,95 @@ class AsyncPricingAdapter(ABC):
             )
         
         return dimension
+
+
+class NormalizedPrefetchMixin(ABC):
+    """
+    Batch prefetch for adapters backed by a normalized pricing table.
+    
+    Mix in ahead of AsyncPricingAdapter; subclasses implement
+    _pricing_params and call _prefetch_pricing_rows from prefetch_pricing.
+    """
+    
+    @abstractmethod
+    def _pricing_params(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the lookup parameters for a resource.
+        
+        The keys other than version_id must be column names of the pricing
+        table.
+        
+        Args:
+            resource: Validated resource attributes
+        
+        Returns:
+            Query parameters (also the pricing rule cache key)
+        """
+        pass
+    
+    def _build_pricing_rule(self, row: Any, region: str) -> PricingRule:
+        """Build a PricingRule from a normalized pricing table row."""
+        return PricingRule(
+            id=row.id,
+            service_code=self.service_code,
+            region_code=region,
+            price_per_unit=row.price_per_unit,
+            unit=row.unit,
+            currency=row.currency,
+            attributes={"sku": row.sku}
+        )
+    
+    async def _prefetch_pricing_rows(
+        self,
+        table: str,
+        resources: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Match every uncached lookup against a normalized table in one query.
+        
+        An estimate typically prices a handful of distinct shapes across many
+        resources; instead of one round trip per distinct shape, all of them
+        are fetched together and cached for match_pricing.
+        
+        Args:
+            table: Normalized pricing table
+            resources: Resource attribute dicts about to be priced
+        """
+        wanted = {}
+        for resource in resources:
+            try:
+                self.validate(resource)
+            except ValidationError:
+                # Reported per resource by the normal pipeline
+                continue
+            
+            params = self._pricing_params(resource)
+            if self._get_cached_pricing_rule(params) is None:
+                wanted[self._pricing_cache_key(params)] = params
+        
+        if not wanted:
+            return
+        
+        version_id = self.pricing_version.id
+        key_columns = tuple(col for col in next(iter(wanted.values())) if col != "version_id")
+        
+        query_params = {"version_id": version_id}
+        for col in key_columns:
+            query_params[col] = sorted({params[col] for params in wanted.values()})
+        
+        result = await self.db.execute(
+            _build_prefetch_query(table, key_columns), query_params
+        )
+        
+        for row in result:
+            params = {"version_id": version_id}
+            for col in key_columns:
+                params[col] = getattr(row, col)
+            
+            key = self._pricing_cache_key(params)
+            # Pop so a key with several rows keeps the first (match_pricing
+            # takes LIMIT 1 as well)
+            if wanted.pop(key, None) is not None:
+                self._cache_pricing_rule(
+                    params, self._build_pricing_rule(row, params["region"])
+                )
@@ -18,6 +18,9 @@ from app.pricing.adapters.base import (
 
 logger = logging.getLogger(__name__)
 
+# Hours in a standard month (365 days / 12 months * 24 hours), built once
+_HOURS_PER_MONTH = Decimal("730")
+
 
 class AsyncEC2Adapter(AsyncPricingAdapter):
     """
@@ -91,8 +94,8 @@ class AsyncEC2Adapter(AsyncPricingAdapter):
         # Convert to PricingRule
         return PricingRule(
             id=dimension.id,
-            service_code=dimension.service_code,
-            region_code=dimension.region_code,
+            service_code=self.service_code,
+            region_code=region,
             price_per_unit=dimension.price_per_unit,
             unit=dimension.unit,
             currency=dimension.currency,
@@ -107,7 +110,7 @@ class AsyncEC2Adapter(AsyncPricingAdapter):
         
         # Calculate
         hourly_rate = pricing_rule.price_per_unit
-        hours_per_month = Decimal("730")
+        hours_per_month = _HOURS_PER_MONTH
         monthly_cost = hourly_rate * hours_per_month
         
         # Build calculation steps
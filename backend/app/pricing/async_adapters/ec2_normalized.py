@@ -4,10 +4,15 @@ NO JSON filtering - deterministic SKU matching.
 """
 import logging
 from typing import Dict, Any, List
-from decimal import Decimal
 from sqlalchemy import select, text
 
-from app.pricing.async_adapters.base import AsyncPricingAdapter
+from app.pricing.async_adapters.base import (
+    AsyncPricingAdapter,
+    NormalizedPrefetchMixin,
+    NORMALIZED_SUPPORTED_REGIONS,
+    NORMALIZED_SUPPORTED_REGION_SET
+)
+from app.models.usage_model import UsageModel
 from app.pricing.adapters.base import (
     PricingRule,
     CostResult,
@@ -20,7 +25,7 @@ from app.pricing.adapters.base import (
 logger = logging.getLogger(__name__)
 
 
-class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
+class AsyncEC2AdapterNormalized(NormalizedPrefetchMixin, AsyncPricingAdapter):
     """
     Async EC2 adapter using normalized pricing_ec2 table.
     Deterministic SKU matching - no JSON filtering.
@@ -32,13 +37,7 @@ class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
     
     @property
     def supported_regions(self) -> List[str]:
-        return [
-            "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-            "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
-            "ap-south-1", "ap-southeast-1", "ap-southeast-2",
-            "ap-northeast-1", "ap-northeast-2", "ap-northeast-3",
-            "ca-central-1", "sa-east-1"
-        ]
+        return NORMALIZED_SUPPORTED_REGIONS
     
     @property
     def service_code(self) -> str:
@@ -57,7 +56,7 @@ class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
             )
         
         region = resource.get("region")
-        if region not in self.supported_regions:
+        if region not in NORMALIZED_SUPPORTED_REGION_SET:
             raise ValidationError(
                 f"Region '{region}' not supported for {self.service_code}"
             )
@@ -68,16 +67,39 @@ class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
                 f"Invalid instance_type format: '{instance_type}'"
             )
     
+    def _pricing_params(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the pricing_ec2 lookup parameters for a resource.
+        
+        Args:
+            resource: Validated EC2 resource attributes
+        
+        Returns:
+            Query parameters (also the pricing rule cache key)
+        """
+        return {
+            "version_id": self.pricing_version.id,
+            "instance_type": resource["instance_type"],
+            "region": resource["region"],
+            "operating_system": resource.get("operating_system", "Linux"),
+            "tenancy": resource.get("tenancy", "Shared"),
+            "capacity_status": resource.get("capacity_status", "Used")
+        }
+    
+    async def prefetch_pricing(self, resources: List[Dict[str, Any]]) -> None:
+        """Match every uncached EC2 lookup in one pricing_ec2 query."""
+        await self._prefetch_pricing_rows("pricing_ec2", resources)
+    
     async def match_pricing(self, resource: Dict[str, Any]) -> PricingRule:
         """
         Match EC2 instance to pricing using normalized table.
         Deterministic query - no JSON filtering.
         """
-        instance_type = resource["instance_type"]
-        region = resource["region"]
-        operating_system = resource.get("operating_system", "Linux")
-        tenancy = resource.get("tenancy", "Shared")
-        capacity_status = resource.get("capacity_status", "Used")
+        params = self._pricing_params(resource)
+        
+        cached = self._get_cached_pricing_rule(params)
+        if cached is not None:
+            return cached
         
         # Query normalized pricing_ec2 table
         query = text("""
@@ -92,31 +114,19 @@ class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
             LIMIT 1
         """)
         
-        result = await self.db.execute(query, {
-            "version_id": self.pricing_version.id,
-            "instance_type": instance_type,
-            "region": region,
-            "operating_system": operating_system,
-            "tenancy": tenancy,
-            "capacity_status": capacity_status
-        })
+        result = await self.db.execute(query, params)
         
         row = result.fetchone()
         
         if row is None:
             raise PricingMatchError(
-                f"No pricing found for EC2: instance_type={instance_type}, "
-                f"region={region}, os={operating_system}, tenancy={tenancy}"
+                f"No pricing found for EC2: instance_type={params['instance_type']}, "
+                f"region={params['region']}, os={params['operating_system']}, "
+                f"tenancy={params['tenancy']}"
             )
         
-        return PricingRule(
-            id=row.id,
-            service_code=self.service_code,
-            region_code=region,
-            price_per_unit=Decimal(str(row.price_per_unit)),
-            unit=row.unit,
-            currency=row.currency,
-            attributes={"sku": row.sku}
+        return self._cache_pricing_rule(
+            params, self._build_pricing_rule(row, params["region"])
         )
     
     def calculate(self, resource: Dict[str, Any], pricing_rule: PricingRule) -> CostResult:
@@ -130,8 +140,6 @@ class AsyncEC2AdapterNormalized(AsyncPricingAdapter):
             raise ValueError(f"Expected unit 'Hrs', got '{pricing_rule.unit}'")
         
         # CRITICAL: usage_model is REQUIRED (no defaults)
-        from app.models.usage_model import UsageModel
-        
         if "usage_model" not in resource:
             raise ValueError(
                 "usage_model is REQUIRED for EC2 cost calculation. "
@@ -3,11 +3,16 @@ Async Lambda adapter using normalized pricing tables.
 NO JSON filtering - deterministic SKU matching.
 """
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Tuple
 from decimal import Decimal
 from sqlalchemy import text
 
-from app.pricing.async_adapters.base import AsyncPricingAdapter
+from app.pricing.async_adapters.base import (
+    AsyncPricingAdapter,
+    NORMALIZED_SUPPORTED_REGIONS,
+    NORMALIZED_SUPPORTED_REGION_SET
+)
 from app.pricing.adapters.base import (
     PricingRule,
     CostResult,
@@ -19,6 +24,106 @@ from app.pricing.adapters.base import (
 
 logger = logging.getLogger(__name__)
 
+# Monthly free tier: 1M requests + 400,000 GB-seconds
+LAMBDA_FREE_REQUESTS = Decimal("1000000")
+LAMBDA_FREE_GB_SECONDS = Decimal("400000")
+LAMBDA_DURATION_RATE = Decimal("0.0000166667")  # Approximate, USD per GB-second
+_ONE_MILLION = Decimal("1000000")
+_UNLIMITED = Decimal("Infinity")
+_ZERO = Decimal("0")
+_MB_PER_GB = Decimal("1024")
+_MS_PER_SECOND = Decimal("1000")
+
+# (upper_limit, rate) tiers; the zero-rate first tier is the free tier
+LAMBDA_GB_SECOND_TIERS: Tuple[Tuple[Decimal, Decimal], ...] = (
+    (LAMBDA_FREE_GB_SECONDS, _ZERO),
+    (_UNLIMITED, LAMBDA_DURATION_RATE),
+)
+
+
+def apply_tiers(quantity: Decimal, tiers: Tuple[Tuple[Decimal, Decimal], ...]) -> Decimal:
+    """
+    Price a quantity against ascending (upper_limit, rate) tiers.
+    
+    Args:
+        quantity: Billable quantity
+        tiers: Tiers ordered by upper limit; last limit should be Infinity
+    
+    Returns:
+        Total cost across all tiers
+    """
+    # Flat rate: a single unbounded tier is one multiplication
+    if len(tiers) == 1 and tiers[0][0] == _UNLIMITED:
+        return quantity * tiers[0][1]
+    
+    cost = _ZERO
+    previous_limit = _ZERO
+    
+    for limit, rate in tiers:
+        if quantity <= previous_limit:
+            break
+        cost += (min(quantity, limit) - previous_limit) * rate
+        previous_limit = limit
+    
+    return cost
+
+
+def compile_tiers(tiers: Tuple[Tuple[Decimal, Decimal], ...]) -> Callable[[Decimal], Decimal]:
+    """
+    Build a pricing function specialized to the shape of a tier table.
+    
+    Lambda tiers are a free allowance followed by a flat rate, which
+    collapses to straight-line arithmetic with the limit and rate bound as
+    locals, so the hot path skips the generic tier walk. Any other shape
+    (including a single flat rate, which apply_tiers already short-circuits)
+    falls back to apply_tiers.
+    
+    Args:
+        tiers: Tiers ordered by upper limit; last limit should be Infinity
+    
+    Returns:
+        Function mapping a billable quantity to its total cost
+    """
+    if (
+        len(tiers) == 2
+        and tiers[0][1] == _ZERO
+        and tiers[1][0] == _UNLIMITED
+    ):
+        free_limit, rate = tiers[0][0], tiers[1][1]
+        
+        def free_then_flat(quantity: Decimal) -> Decimal:
+            if quantity <= free_limit:
+                return _ZERO
+            return (quantity - free_limit) * rate
+        
+        return free_then_flat
+    
+    return lambda quantity: apply_tiers(quantity, tiers)
+
+
+# Duration tiers are static, so their pricing function is built once
+price_gb_seconds = compile_tiers(LAMBDA_GB_SECOND_TIERS)
+
+
+@lru_cache(maxsize=64)
+def request_pricer(request_rate: Decimal) -> Callable[[Decimal], Decimal]:
+    """
+    Get the compiled request pricing function for a per-million rate.
+    
+    CRITICAL: Cached per rate so calculate() does not rebuild the tier
+    table and closure for every function priced.
+    
+    Args:
+        request_rate: USD per million requests
+    
+    Returns:
+        Function mapping invocations to request cost after the free tier
+    """
+    return compile_tiers((
+        (LAMBDA_FREE_REQUESTS, _ZERO),
+        (_UNLIMITED, request_rate / _ONE_MILLION),
+    ))
+
 
 class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
     """
@@ -32,13 +137,7 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
     
     @property
     def supported_regions(self) -> List[str]:
-        return [
-            "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-            "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
-            "ap-south-1", "ap-southeast-1", "ap-southeast-2",
-            "ap-northeast-1", "ap-northeast-2", "ap-northeast-3",
-            "ca-central-1", "sa-east-1"
-        ]
+        return NORMALIZED_SUPPORTED_REGIONS
     
     @property
     def service_code(self) -> str:
@@ -52,7 +151,7 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
                 f"Missing required attribute 'region' for {self.service_code}"
             )
         
-        if region not in self.supported_regions:
+        if region not in NORMALIZED_SUPPORTED_REGION_SET:
             raise ValidationError(
                 f"Region '{region}' not supported for {self.service_code}"
             )
@@ -75,11 +174,17 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
             LIMIT 1
         """)
         
-        result = await self.db.execute(query, {
+        params = {
             "version_id": self.pricing_version.id,
             "region": region,
             "group_description": group_description
-        })
+        }
+        
+        cached = self._get_cached_pricing_rule(params)
+        if cached is not None:
+            return cached
+        
+        result = await self.db.execute(query, params)
         
         row = result.fetchone()
         
@@ -88,15 +193,17 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
                 f"No pricing found for Lambda: region={region}"
             )
         
-        return PricingRule(
+        rule = PricingRule(
             id=row.id,
             service_code=self.service_code,
             region_code=region,
-            price_per_unit=Decimal(str(row.price_per_unit)),
+            price_per_unit=row.price_per_unit,
             unit=row.unit,
             currency=row.currency,
             attributes={"sku": row.sku}
         )
+        
+        return self._cache_pricing_rule(params, rule)
     
     def calculate(self, resource: Dict[str, Any], pricing_rule: PricingRule) -> CostResult:
         """Calculate Lambda cost."""
@@ -105,30 +212,28 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
         duration_ms = Decimal(str(resource.get("estimated_duration_ms", 1000)))
         memory_mb = Decimal(str(resource.get("memory_size", 128)))
         
-        # Request cost
+        # Request cost (first 1M requests free)
         request_rate = pricing_rule.price_per_unit  # Per million requests
-        request_cost = (invocations / Decimal("1000000")) * request_rate
+        request_cost = request_pricer(request_rate)(invocations)
         
         # Duration cost (simplified - would need separate pricing query)
-        memory_gb = memory_mb / Decimal("1024")
-        duration_seconds = duration_ms / Decimal("1000")
+        memory_gb = memory_mb / _MB_PER_GB
+        duration_seconds = duration_ms / _MS_PER_SECOND
         gb_seconds = invocations * memory_gb * duration_seconds
-        duration_rate = Decimal("0.0000166667")  # Approximate
-        duration_cost = gb_seconds * duration_rate
+        duration_rate = LAMBDA_DURATION_RATE
+        duration_cost = price_gb_seconds(gb_seconds)
         
         monthly_cost = request_cost + duration_cost
         
         # Free tier: 1M requests + 400,000 GB-seconds
-        free_tier_status = FreeTierStatus.NOT_APPLICABLE
         warnings = []
         
-        if invocations <= 1000000 and gb_seconds <= 400000:
-            free_tier_status = FreeTierStatus.WITHIN_FREE_TIER
-            monthly_cost = Decimal("0")
+        if invocations <= LAMBDA_FREE_REQUESTS and gb_seconds <= LAMBDA_FREE_GB_SECONDS:
+            free_tier_status = FreeTierStatus.APPLIED
             warnings.append("Within free tier limits")
-        elif invocations > 1000000 or gb_seconds > 400000:
+        else:
             free_tier_status = FreeTierStatus.EXCEEDED
-            warnings.append("Exceeds free tier - using estimated pricing")
+            warnings.append("Exceeds free tier - free tier allowance deducted")
         
         steps = [
             CalculationStep(
@@ -140,7 +245,7 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
             ),
             CalculationStep(
                 description="Request cost",
-                formula="(invocations / 1M) * request_rate",
+                formula="max(invocations - 1M, 0) / 1M * request_rate",
                 inputs={
                     "invocations": float(invocations),
                     "request_rate": float(request_rate)
@@ -150,7 +255,7 @@ class AsyncLambdaAdapterNormalized(AsyncPricingAdapter):
             ),
             CalculationStep(
                 description="Duration cost (estimated)",
-                formula="gb_seconds * duration_rate",
+                formula="max(gb_seconds - 400000, 0) * duration_rate",
                 inputs={
                     "gb_seconds": float(gb_seconds),
                     "duration_rate": float(duration_rate)
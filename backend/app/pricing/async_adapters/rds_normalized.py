@@ -7,7 +7,13 @@ from typing import Dict, Any, List
 from decimal import Decimal
 from sqlalchemy import text
 
-from app.pricing.async_adapters.base import AsyncPricingAdapter
+from app.pricing.async_adapters.base import (
+    AsyncPricingAdapter,
+    NormalizedPrefetchMixin,
+    NORMALIZED_SUPPORTED_REGIONS,
+    NORMALIZED_SUPPORTED_REGION_SET
+)
+from app.models.usage_model import UsageModel
 from app.pricing.adapters.base import (
     PricingRule,
     CostResult,
@@ -20,7 +26,7 @@ from app.pricing.adapters.base import (
 logger = logging.getLogger(__name__)
 
 
-class AsyncRDSAdapterNormalized(AsyncPricingAdapter):
+class AsyncRDSAdapterNormalized(NormalizedPrefetchMixin, AsyncPricingAdapter):
     """
     Async RDS adapter using normalized pricing_rds table.
     Deterministic SKU matching - no JSON filtering.
@@ -32,13 +38,7 @@ class AsyncRDSAdapterNormalized(AsyncPricingAdapter):
     
     @property
     def supported_regions(self) -> List[str]:
-        return [
-            "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-            "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
-            "ap-south-1", "ap-southeast-1", "ap-southeast-2",
-            "ap-northeast-1", "ap-northeast-2", "ap-northeast-3",
-            "ca-central-1", "sa-east-1"
-        ]
+        return NORMALIZED_SUPPORTED_REGIONS
     
     @property
     def service_code(self) -> str:
@@ -57,20 +57,44 @@ class AsyncRDSAdapterNormalized(AsyncPricingAdapter):
             )
         
         region = resource.get("region")
-        if region not in self.supported_regions:
+        if region not in NORMALIZED_SUPPORTED_REGION_SET:
             raise ValidationError(
                 f"Region '{region}' not supported for {self.service_code}"
             )
     
+    def _pricing_params(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the pricing_rds lookup parameters for a resource.
+        
+        Args:
+            resource: Validated RDS resource attributes
+        
+        Returns:
+            Query parameters keyed by pricing_rds column name (prefetch
+            selects and filters on them; also the pricing rule cache key)
+        """
+        return {
+            "version_id": self.pricing_version.id,
+            "instance_class": resource["instance_class"],
+            "database_engine": resource["engine"],
+            "region": resource["region"],
+            "deployment_option": resource.get("deployment_option", "Single-AZ")
+        }
+    
+    async def prefetch_pricing(self, resources: List[Dict[str, Any]]) -> None:
+        """Match every uncached RDS lookup in one pricing_rds query."""
+        await self._prefetch_pricing_rows("pricing_rds", resources)
+    
     async def match_pricing(self, resource: Dict[str, Any]) -> PricingRule:
         """
         Match RDS instance to pricing using normalized table.
         Deterministic query - no JSON filtering.
         """
-        instance_class = resource["instance_class"]
-        engine = resource["engine"]
-        region = resource["region"]
-        deployment_option = resource.get("deployment_option", "Single-AZ")
+        params = self._pricing_params(resource)
+        
+        cached = self._get_cached_pricing_rule(params)
+        if cached is not None:
+            return cached
         
         # Query normalized pricing_rds table
         query = text("""
@@ -78,36 +102,25 @@ class AsyncRDSAdapterNormalized(AsyncPricingAdapter):
             FROM pricing_rds
             WHERE version_id = :version_id
               AND instance_class = :instance_class
-              AND engine = :engine
+              AND database_engine = :database_engine
               AND region = :region
               AND deployment_option = :deployment_option
             LIMIT 1
         """)
         
-        result = await self.db.execute(query, {
-            "version_id": self.pricing_version.id,
-            "instance_class": instance_class,
-            "engine": engine,
-            "region": region,
-            "deployment_option": deployment_option
-        })
+        result = await self.db.execute(query, params)
         
         row = result.fetchone()
         
         if row is None:
             raise PricingMatchError(
-                f"No pricing found for RDS: instance_class={instance_class}, "
-                f"engine={engine}, region={region}, deployment={deployment_option}"
+                f"No pricing found for RDS: instance_class={params['instance_class']}, "
+                f"engine={params['database_engine']}, region={params['region']}, "
+                f"deployment={params['deployment_option']}"
             )
         
-        return PricingRule(
-            id=row.id,
-            service_code=self.service_code,
-            region_code=region,
-            price_per_unit=Decimal(str(row.price_per_unit)),
-            unit=row.unit,
-            currency=row.currency,
-            attributes={"sku": row.sku}
+        return self._cache_pricing_rule(
+            params, self._build_pricing_rule(row, params["region"])
         )
     
     def calculate(self, resource: Dict[str, Any], pricing_rule: PricingRule) -> CostResult:
@@ -120,8 +133,6 @@ class AsyncRDSAdapterNormalized(AsyncPricingAdapter):
             raise ValueError(f"Expected unit 'Hrs', got '{pricing_rule.unit}'")
         
         # CRITICAL: usage_model is REQUIRED (no defaults)
-        from app.models.usage_model import UsageModel
-        
         if "usage_model" not in resource:
             raise ValueError(
                 "usage_model is REQUIRED for RDS cost calculation. "
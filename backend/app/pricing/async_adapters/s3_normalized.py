@@ -7,7 +7,11 @@ from typing import Dict, Any, List
 from decimal import Decimal
 from sqlalchemy import text
 
-from app.pricing.async_adapters.base import AsyncPricingAdapter
+from app.pricing.async_adapters.base import (
+    AsyncPricingAdapter,
+    NORMALIZED_SUPPORTED_REGIONS,
+    NORMALIZED_SUPPORTED_REGION_SET
+)
 from app.pricing.adapters.base import (
     PricingRule,
     CostResult,
@@ -32,13 +36,7 @@ class AsyncS3AdapterNormalized(AsyncPricingAdapter):
     
     @property
     def supported_regions(self) -> List[str]:
-        return [
-            "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-            "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
-            "ap-south-1", "ap-southeast-1", "ap-southeast-2",
-            "ap-northeast-1", "ap-northeast-2", "ap-northeast-3",
-            "ca-central-1", "sa-east-1"
-        ]
+        return NORMALIZED_SUPPORTED_REGIONS
     
     @property
     def service_code(self) -> str:
@@ -52,7 +50,7 @@ class AsyncS3AdapterNormalized(AsyncPricingAdapter):
                 f"Missing required attribute 'region' for {self.service_code}"
             )
         
-        if region not in self.supported_regions:
+        if region not in NORMALIZED_SUPPORTED_REGION_SET:
             raise ValidationError(
                 f"Region '{region}' not supported for {self.service_code}"
             )
@@ -77,12 +75,18 @@ class AsyncS3AdapterNormalized(AsyncPricingAdapter):
             LIMIT 1
         """)
         
-        result = await self.db.execute(query, {
+        params = {
             "version_id": self.pricing_version.id,
             "region": region,
             "storage_class": storage_class,
             "volume_type": volume_type
-        })
+        }
+        
+        cached = self._get_cached_pricing_rule(params)
+        if cached is not None:
+            return cached
+        
+        result = await self.db.execute(query, params)
         
         row = result.fetchone()
         
@@ -92,15 +96,17 @@ class AsyncS3AdapterNormalized(AsyncPricingAdapter):
                 f"storage_class={storage_class}, volume_type={volume_type}"
             )
         
-        return PricingRule(
+        rule = PricingRule(
             id=row.id,
             service_code=self.service_code,
             region_code=region,
-            price_per_unit=Decimal(str(row.price_per_unit)),
+            price_per_unit=row.price_per_unit,
             unit=row.unit,
             currency=row.currency,
             attributes={"sku": row.sku}
         )
+        
+        return self._cache_pricing_rule(params, rule)
     
     def calculate(self, resource: Dict[str, Any], pricing_rule: PricingRule) -> CostResult:
         """Calculate S3 cost."""
@@ -2,16 +2,24 @@
 AWS Pricing API ingestion module.
 Downloads pricing data from official AWS Pricing API endpoints.
 """
-import json
+import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
+from email.utils import formatdate
 import httpx
+import orjson
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Streaming download chunk size (1 MB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent offer-file downloads; stays under the client's connection limit
+DOWNLOAD_MAX_CONCURRENCY = 4
+
 
 class PricingIngestionError(Exception):
     """Raised when pricing ingestion fails."""
@@ -22,7 +30,9 @@ class AWSPricingIngestion:
     """
     AWS Pricing API client for downloading pricing data.
     
-    Uses the AWS Price List API to download bulk pricing files.
+    Uses the AWS Price List API to download bulk pricing files. All
+    requests share one async HTTP client, so downloads run concurrently on
+    the event loop and reuse pooled keep-alive connections.
     """
     
     def __init__(self):
@@ -32,34 +42,48 @@ class AWSPricingIngestion:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # HTTP client with retry logic
-        self.client = httpx.Client(
+        self.client = httpx.AsyncClient(
             timeout=300.0,  # 5 minutes for large files
             limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            transport=httpx.HTTPTransport(retries=3)
+            transport=httpx.AsyncHTTPTransport(retries=3)
         )
+        
+        # Service index is fetched once per ingestion run, not once per service
+        self._service_index: Optional[Dict] = None
+        
+        # Services whose offer file came back 304 Not Modified this run
+        self.unchanged_services: Set[str] = set()
     
-    def get_service_index(self) -> Dict:
+    async def get_service_index(self, refresh: bool = False) -> Dict:
         """
         Get the index of all available pricing files.
         
+        Args:
+            refresh: Re-fetch the index even if it was already loaded
+        
         Returns:
             Dictionary mapping service codes to pricing file URLs
         """
+        if self._service_index is not None and not refresh:
+            return self._service_index
+        
         try:
             # AWS provides a JSON index of all pricing files
             index_url = f"{self.bulk_url}/offers/v1.0/aws/index.json"
             logger.info(f"Fetching pricing index from {index_url}")
             
-            response = self.client.get(index_url)
+            response = await self.client.get(index_url)
             response.raise_for_status()
             
-            index_data = response.json()
-            return index_data.get("offers", {})
+            # Parse the raw body bytes with orjson (no str decode step)
+            index_data = orjson.loads(response.content)
+            self._service_index = index_data.get("offers", {})
+            return self._service_index
         
-        except httpx.HTTPError as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             raise PricingIngestionError(f"Failed to fetch pricing index: {e}")
     
-    def download_service_pricing(self, service_code: str) -> Optional[Path]:
+    async def download_service_pricing(self, service_code: str) -> Optional[Path]:
         """
         Download pricing data for a specific service.
         
@@ -67,18 +91,26 @@ class AWSPricingIngestion:
             service_code: AWS service code (e.g., 'AmazonEC2')
         
         Returns:
-            Path to downloaded pricing file, or None if not available
+            Path to downloaded pricing file, or None if not available.
+            When AWS reports the file unchanged, the previously downloaded
+            file is returned and the service is added to unchanged_services.
         """
         try:
             # Get service index
-            index = self.get_service_index()
+            index = await self.get_service_index()
             
             if service_code not in index:
                 logger.warning(f"Service {service_code} not found in pricing index")
                 return None
             
             service_info = index[service_code]
-            current_version = service_info.get("currentVersion")
+            # The bulk index publishes the complete current offer file path
+            # as currentVersionUrl: one GET per service (gzip-encoded, which
+            # httpx negotiates by default) instead of paginated GetProducts
+            current_version = (
+                service_info.get("currentVersionUrl")
+                or service_info.get("currentVersion")
+            )
             
             if not current_version:
                 logger.warning(f"No current version for service {service_code}")
@@ -89,13 +121,38 @@ class AWSPricingIngestion:
             
             logger.info(f"Downloading pricing for {service_code} from {pricing_url}")
             
-            # Download pricing file
-            response = self.client.get(pricing_url)
-            response.raise_for_status()
+            # Conditional GET: AWS returns 304 with no body when the offer
+            # file has not changed since our last download
+            headers = {}
+            previous_file = self._latest_pricing_file(service_code)
+            if previous_file:
+                headers["If-Modified-Since"] = formatdate(
+                    previous_file.stat().st_mtime, usegmt=True
+                )
             
-            # Save to file
             output_file = self.data_dir / f"{service_code}_{datetime.now().strftime('%Y%m%d')}.json"
-            output_file.write_bytes(response.content)
+            partial_file = output_file.with_suffix(".json.part")
+            
+            # Stream to disk in 1 MB chunks: offer files are hundreds of MB
+            # and must not be buffered whole in memory
+            async with self.client.stream("GET", pricing_url, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.info(f"{service_code} pricing unchanged since {previous_file.name}")
+                    # Still returned so a run where other services changed
+                    # builds a complete version from every service's data
+                    self.unchanged_services.add(service_code)
+                    return previous_file
+                
+                response.raise_for_status()
+                
+                # Local 1 MB writes are short next to network waits, so they
+                # stay inline rather than paying a thread hop per chunk
+                with open(partial_file, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            
+            # Rename only once complete so a partial download is never loaded
+            partial_file.replace(output_file)
             
             logger.info(f"Downloaded {service_code} pricing to {output_file}")
             return output_file
@@ -103,7 +160,20 @@ class AWSPricingIngestion:
         except httpx.HTTPError as e:
             raise PricingIngestionError(f"Failed to download pricing for {service_code}: {e}")
     
-    def download_all_supported_services(self) -> Dict[str, Path]:
+    def _latest_pricing_file(self, service_code: str) -> Optional[Path]:
+        """
+        Find the most recent downloaded pricing file for a service.
+        
+        Args:
+            service_code: AWS service code
+        
+        Returns:
+            Path to latest file, or None if never downloaded
+        """
+        # File names end in YYYYMMDD, so lexical order is chronological
+        return max(self.data_dir.glob(f"{service_code}_*.json"), default=None)
+    
+    async def download_all_supported_services(self) -> Dict[str, Path]:
         """
         Download pricing for all supported services.
         
@@ -111,24 +181,63 @@ class AWSPricingIngestion:
             Dictionary mapping service codes to downloaded file paths
         """
         results = {}
+        service_codes = list(settings.supported_services)
         
-        for service_code in settings.supported_services:
-            try:
-                logger.info(f"Processing service: {service_code}")
-                file_path = self.download_service_pricing(service_code)
-                
-                if file_path:
-                    results[service_code] = file_path
-                    logger.info(f"Successfully downloaded {service_code}")
-                else:
-                    logger.warning(f"Skipped {service_code} - not available")
-            
-            except Exception as e:
-                logger.error(f"Error downloading {service_code}: {e}")
-                continue
+        if not service_codes:
+            return results
+        
+        # Load the index once up front so concurrent tasks only read it
+        try:
+            await self.get_service_index()
+        except PricingIngestionError as e:
+            logger.error(f"Error downloading pricing index: {e}")
+            return results
+        
+        # Downloads are network-bound and independent per service, so they
+        # overlap on the event loop; the semaphore bounds concurrent
+        # transfers to stay clear of Price List API throttling
+        semaphore = asyncio.Semaphore(DOWNLOAD_MAX_CONCURRENCY)
+        
+        async def bounded_download(service_code: str) -> Optional[Path]:
+            async with semaphore:
+                return await self._download_service_logged(service_code)
+        
+        file_paths = await asyncio.gather(
+            *(bounded_download(service_code) for service_code in service_codes)
+        )
+        
+        # gather preserves order, so results follow the configured order
+        for service_code, file_path in zip(service_codes, file_paths):
+            if file_path:
+                results[service_code] = file_path
         
         return results
     
+    async def _download_service_logged(self, service_code: str) -> Optional[Path]:
+        """
+        Download one service's pricing, logging instead of raising on failure.
+        
+        Args:
+            service_code: AWS service code
+        
+        Returns:
+            Path to downloaded pricing file, or None if skipped or failed
+        """
+        try:
+            logger.info(f"Processing service: {service_code}")
+            file_path = await self.download_service_pricing(service_code)
+            
+            if file_path:
+                logger.info(f"Successfully downloaded {service_code}")
+            else:
+                logger.warning(f"Skipped {service_code} - not available")
+            
+            return file_path
+        
+        except Exception as e:
+            logger.error(f"Error downloading {service_code}: {e}")
+            return None
+    
     def load_pricing_file(self, file_path: Path) -> Dict:
         """
         Load and parse a pricing JSON file.
@@ -140,28 +249,47 @@ class AWSPricingIngestion:
             Parsed pricing data
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # orjson tokenizes in C straight from bytes (no str decode step);
+            # several times faster than json.load on multi-hundred-MB offer files
+            return orjson.loads(Path(file_path).read_bytes())
         except Exception as e:
             raise PricingIngestionError(f"Failed to load pricing file {file_path}: {e}")
     
-    def close(self):
+    async def close(self):
         """Close HTTP client."""
-        self.client.close()
+        await self.client.aclose()
     
-    def __enter__(self):
+    async def __aenter__(self):
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
 
 def download_pricing_data() -> Dict[str, Path]:
     """
     Convenience function to download all pricing data.
     
+    Synchronous entry point for the scheduler's worker thread; runs the
+    concurrent downloads on a private event loop. Must not be called from a
+    thread that is already running an event loop (asyncio.run() raises).
+    
     Returns:
-        Dictionary mapping service codes to downloaded file paths
+        Dictionary mapping service codes to downloaded file paths; empty if
+        nothing was downloaded or every service's pricing is unchanged
     """
-    with AWSPricingIngestion() as ingestion:
-        return ingestion.download_all_supported_services()
+    return asyncio.run(_download_pricing_data())
+
+
+async def _download_pricing_data() -> Dict[str, Path]:
+    """Download all supported services with a single shared client."""
+    async with AWSPricingIngestion() as ingestion:
+        pricing_files = await ingestion.download_all_supported_services()
+        
+        # CRITICAL: Re-normalizing unchanged files would only create a new
+        # version identical to the current one
+        if pricing_files and set(pricing_files) <= ingestion.unchanged_services:
+            logger.info("Pricing unchanged for all services - no new version needed")
+            return {}
+        
+        return pricing_files
@@ -50,7 +50,7 @@ class AWSPricingNormalizer:
             version=datetime.now().strftime("%Y%m%d_%H%M%S"),
             is_active=True,
             source=source,
-            metadata={"created_by": "pricing_ingestion"}
+            metadata_={"created_by": "pricing_ingestion"}
         )
         
         self.db.add(version)
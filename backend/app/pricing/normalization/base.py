@@ -2,15 +2,243 @@
 Base pricing normalizer.
 Defines interface for service-specific normalizers.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
 from decimal import Decimal
+import ijson
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Postgres caps bind parameters per statement at 32767
+MAX_BIND_PARAMS = 32767
+
+# Normalized products buffered before each store (one commit per file)
+NORMALIZE_BATCH_SIZE = 10000
+
+# Per-SKU error messages kept for the failure report
+ERROR_SAMPLE_SIZE = 5
+
+# Read size for ijson offer-file scans (its default is 64 KB); larger reads
+# mean fewer syscalls and parser refills across multi-GB files
+IJSON_BUFFER_SIZE = 1 << 20
+
+# ijson silently falls back to its pure-Python backend (an order of
+# magnitude slower) when the yajl2 C extension cannot be loaded
+if ijson.backend != "yajl2_c":
+    logger.warning(
+        f"ijson is using the '{ijson.backend}' backend; offer-file scans will be "
+        f"much slower without the yajl2_c extension"
+    )
+
+# AWS offer-file location names -> region codes, shared by every normalizer
+# (built once at import instead of once per SKU)
+LOCATION_REGION_MAP: Dict[str, str] = {
+    "US East (N. Virginia)": "us-east-1",
+    "US East (Ohio)": "us-east-2",
+    "US West (N. California)": "us-west-1",
+    "US West (Oregon)": "us-west-2",
+    "EU (Ireland)": "eu-west-1",
+    "EU (London)": "eu-west-2",
+    "EU (Paris)": "eu-west-3",
+    "EU (Frankfurt)": "eu-central-1",
+    "Asia Pacific (Mumbai)": "ap-south-1",
+    "Asia Pacific (Singapore)": "ap-southeast-1",
+    "Asia Pacific (Sydney)": "ap-southeast-2",
+    "Asia Pacific (Tokyo)": "ap-northeast-1",
+    "Asia Pacific (Seoul)": "ap-northeast-2",
+    "Canada (Central)": "ca-central-1",
+    "South America (São Paulo)": "sa-east-1"
+}
+
+
+def extract_attributes(
+    attributes: Dict[str, Any],
+    getter: Callable[[Dict[str, Any]], Tuple[Any, ...]],
+    defaults: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    """
+    Pull a fixed set of product attributes in one itemgetter call.
+    
+    Most offer-file products carry every attribute a normalizer needs, so the
+    common case is a single C-level lookup; only products missing a key pay
+    for merging in the defaults.
+    
+    Args:
+        attributes: Raw product attributes
+        getter: operator.itemgetter over the keys of defaults
+        defaults: Attribute name -> value used when the product omits it
+    
+    Returns:
+        Attribute values in getter key order
+    """
+    try:
+        return getter(attributes)
+    except KeyError:
+        return getter({**defaults, **attributes})
+
+
+def _statement_row_counts(total: int, max_rows: int) -> List[int]:
+    """
+    Split a row count into VALUES-list sizes drawn from a small fixed set.
+    
+    Full statements carry max_rows; the remainder is broken into powers of
+    two. Every statement shape then comes from at most log2(max_rows) + 1
+    sizes, so the compiled text cache below and the driver's prepared
+    statement cache keep hitting instead of seeing a new size per tail batch.
+    
+    Args:
+        total: Rows to write
+        max_rows: Largest rows-per-statement allowed
+    
+    Returns:
+        Statement sizes summing to total
+    """
+    full, remainder = divmod(total, max_rows)
+    sizes = [max_rows] * full
+    
+    while remainder:
+        size = 1 << (remainder.bit_length() - 1)
+        sizes.append(size)
+        remainder -= size
+    
+    return sizes
+
+
+def _on_conflict_clause(
+    table: str,
+    conflict_columns: Tuple[str, ...],
+    update_columns: Tuple[str, ...]
+) -> str:
+    """
+    Build the ON CONFLICT clause shared by the bulk upsert statements.
+    
+    CRITICAL: The DO UPDATE is guarded by IS DISTINCT FROM, so re-loading an
+    offer file whose prices did not change writes nothing for those keys
+    (no new tuple versions, WAL or index churn); only changed rows are
+    rewritten.
+    
+    Args:
+        table: Target table
+        conflict_columns: Unique constraint columns for ON CONFLICT
+        update_columns: Columns overwritten on conflict
+    
+    Returns:
+        SQL fragment starting with ON CONFLICT
+    """
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+    current = ", ".join(f"{table}.{col}" for col in update_columns)
+    incoming = ", ".join(f"EXCLUDED.{col}" for col in update_columns)
+    
+    return (
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {updates} "
+        f"WHERE ({current}) IS DISTINCT FROM ({incoming})"
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_multirow_upsert(
+    table: str,
+    columns: Tuple[str, ...],
+    conflict_columns: Tuple[str, ...],
+    update_columns: Tuple[str, ...],
+    row_count: int
+) -> TextClause:
+    """
+    Build (once per shape) a multi-row INSERT ... ON CONFLICT statement.
+    
+    Args:
+        table: Target table
+        columns: Inserted columns
+        conflict_columns: Unique constraint columns for ON CONFLICT
+        update_columns: Columns overwritten on conflict
+        row_count: Number of VALUES tuples
+    
+    Returns:
+        Compiled text clause with binds named <column>_<row index>
+    """
+    values = ", ".join(
+        "(" + ", ".join(f":{col}_{i}" for col in columns) + ")"
+        for i in range(row_count)
+    )
+    
+    return text(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values} "
+        f"{_on_conflict_clause(table, conflict_columns, update_columns)}"
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_staged_merge(
+    table: str,
+    staging_table: str,
+    columns: Tuple[str, ...],
+    conflict_columns: Tuple[str, ...],
+    update_columns: Tuple[str, ...]
+) -> str:
+    """
+    Build (once per table) the SQL that merges and drops a COPY staging table.
+    
+    The INSERT ... SELECT and the DROP are one multi-statement string, sent
+    in a single simple-protocol round trip.
+    
+    Args:
+        table: Target table
+        staging_table: Temp table filled by COPY
+        columns: Inserted columns
+        conflict_columns: Unique constraint columns for ON CONFLICT
+        update_columns: Columns overwritten on conflict
+    
+    Returns:
+        SQL string (no binds)
+    """
+    column_list = ", ".join(columns)
+    
+    return (
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging_table} "
+        f"{_on_conflict_clause(table, conflict_columns, update_columns)}; "
+        f"DROP TABLE {staging_table}"
+    )
+
+
+def load_ondemand_pricing(file_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Stream terms.OnDemand from an offer file into a sku -> pricing map.
+    
+    Module-level (not a normalizer method): it touches no session state and
+    runs in a worker thread.
+    
+    Args:
+        file_path: Path to raw AWS pricing JSON
+    
+    Returns:
+        Extracted pricing for every SKU that has an OnDemand price
+    """
+    extract_pricing = BasePricingNormalizer._extract_pricing
+    pricing_by_sku = {}
+    
+    # Most SKUs share a (price, unit) with many others - the same rate in
+    # every location, thousands of $0 SKUs. Keep one dict per distinct
+    # pricing so the map holds each once. Values are only read (merged into
+    # normalized rows), never mutated.
+    distinct_pricing = {}
+    
+    with open(file_path, "rb") as f:
+        for sku, sku_terms in ijson.kvitems(f, "terms.OnDemand", buf_size=IJSON_BUFFER_SIZE):
+            pricing = extract_pricing(sku_terms)
+            if pricing:
+                key = (pricing["price_per_unit"], pricing["unit"])
+                pricing_by_sku[sku] = distinct_pricing.setdefault(key, pricing)
+    
+    return pricing_by_sku
+
 
 class NormalizationError(Exception):
     """Raised when pricing normalization fails."""
@@ -31,6 +259,15 @@ class BasePricingNormalizer(ABC):
     - Normalization failures are fatal
     """
     
+    # Top-level productFamily values this normalizer prices. Offer files mix
+    # in many other families (data transfer, IPs, fees...) that can never
+    # normalize; listing the wanted ones skips those before any attribute
+    # extraction. None keeps every product.
+    product_families: Optional[FrozenSet[str]] = None
+    
+    # Location names this normalizer accepts; subclasses extend the shared map
+    location_map: Dict[str, str] = LOCATION_REGION_MAP
+    
     def __init__(self, db: AsyncSession, version_id: int):
         """
         Initialize normalizer.
@@ -41,6 +278,9 @@ class BasePricingNormalizer(ABC):
         """
         self.db = db
         self.version_id = version_id
+        # required_attributes builds a new list on every access; the per-SKU
+        # validation checks against this set instead
+        self._required_attribute_set = frozenset(self.required_attributes)
     
     @property
     @abstractmethod
@@ -116,58 +356,191 @@ class BasePricingNormalizer(ABC):
         if not products:
             raise NormalizationError(f"No products found for {self.service_code}")
         
+        on_demand = terms.get("OnDemand", {})
+        extract_pricing = self._extract_pricing
+        
+        def get_pricing(sku: str) -> Dict[str, Any]:
+            # SKUs without OnDemand terms are never stored
+            sku_terms = on_demand.get(sku)
+            return extract_pricing(sku_terms) if sku_terms else {}
+        
+        return await self._normalize_products(products.items(), get_pricing)
+    
+    async def normalize_and_store_file(self, file_path: Path) -> int:
+        """
+        Normalization pipeline streaming directly from a downloaded offer file.
+        
+        Uses two ijson passes instead of loading the whole file: pass 1
+        streams terms.OnDemand into a compact sku -> pricing map, pass 2
+        streams products. Peak memory is the pricing map plus the
+        normalized rows, not the ~10x-file-size parsed JSON tree.
+        
+        Args:
+            file_path: Path to raw AWS pricing JSON
+        
+        Returns:
+            Number of products normalized
+        
+        Raises:
+            NormalizationError: If normalization fails
+        """
+        # Pass 1: OnDemand terms (stored after products in AWS offer files).
+        # CPU-bound parsing with no DB access, so it runs in a worker thread
+        # instead of blocking the event loop for the whole scan.
+        pricing_by_sku = await asyncio.to_thread(load_ondemand_pricing, file_path)
+        
+        # Pass 2: products
+        with open(file_path, "rb") as f:
+            count = await self._normalize_products(
+                ijson.kvitems(f, "products", buf_size=IJSON_BUFFER_SIZE),
+                lambda sku: pricing_by_sku.get(sku, {})
+            )
+        
+        return count
+    
+    async def _normalize_products(
+        self,
+        product_items: Iterable[Tuple[str, Dict[str, Any]]],
+        get_pricing: Callable[[str], Dict[str, Any]]
+    ) -> int:
+        """
+        Normalize products and store them.
+        
+        Args:
+            product_items: (sku, product) pairs
+            get_pricing: Returns extracted pricing for a SKU ({} if none)
+        
+        Returns:
+            Number of products normalized
+        
+        Raises:
+            NormalizationError: If normalization fails
+        """
         normalized = []
-        errors = []
+        error_samples = []
+        error_count = 0
+        seen = 0
+        count = 0
+        
+        # Loop invariants hoisted out of the per-SKU loop (runs ~100k times)
+        normalize_product = self.normalize_product
+        append = normalized.append
+        product_families = self.product_families
         
-        for sku, product_data in products.items():
-            try:
-                # Extract product attributes
-                normalized_product = await self.normalize_product(product_data)
+        try:
+            for sku, product_data in product_items:
+                seen += 1
                 
-                # Extract pricing from terms
-                pricing = self._extract_pricing(sku, terms)
-                if pricing:
+                if (
+                    product_families is not None
+                    and product_data.get("productFamily") not in product_families
+                ):
+                    continue
+                
+                try:
+                    # Extract pricing first: unpriced SKUs are skipped before
+                    # paying for attribute extraction
+                    pricing = get_pricing(sku)
+                    if not pricing:
+                        continue
+                    
+                    # Extract product attributes
+                    normalized_product = await normalize_product(product_data)
                     normalized_product.update(pricing)
-                    normalized.append(normalized_product)
+                    append(normalized_product)
+                
+                except Exception as e:
+                    # Only a few messages are ever reported; count the rest
+                    error_count += 1
+                    if error_count <= ERROR_SAMPLE_SIZE:
+                        error_samples.append(f"SKU {sku}: {str(e)}")
+                    logger.warning(f"Failed to normalize SKU {sku}: {e}")
+                    continue
+                
+                # Flush in fixed-size batches so memory stays bounded by one
+                # batch instead of every normalized row in the offer file
+                if len(normalized) >= NORMALIZE_BATCH_SIZE:
+                    count += await self._store_batch(normalized)
+                    normalized.clear()
             
-            except Exception as e:
-                errors.append(f"SKU {sku}: {str(e)}")
-                logger.warning(f"Failed to normalize SKU {sku}: {e}")
-        
-        if not normalized:
-            raise NormalizationError(
-                f"No products normalized for {self.service_code}. Errors: {errors[:5]}"
-            )
+            if not seen:
+                raise NormalizationError(f"No products found for {self.service_code}")
+            
+            if normalized:
+                count += await self._store_batch(normalized)
+            
+            if not count:
+                raise NormalizationError(
+                    f"No products normalized for {self.service_code}. Errors: {error_samples}"
+                )
+            
+            # CRITICAL: One commit for the whole file. A failure part-way through
+            # must not leave a half-loaded version that could later be validated
+            # and activated.
+            await self.db.commit()
         
-        # Store in database
-        count = await self.store_normalized_data(normalized)
+        except Exception:
+            await self.db.rollback()
+            raise
         
         logger.info(
             f"Normalized {count} products for {self.service_code} "
-            f"({len(errors)} errors)"
+            f"({error_count} errors)"
         )
         
         return count
     
-    def _extract_pricing(self, sku: str, terms: Dict[str, Any]) -> Dict[str, Any]:
+    async def _store_batch(self, normalized: List[Dict[str, Any]]) -> int:
+        """
+        Store one batch of normalized products.
+        
+        Batches share the file's transaction; _normalize_products commits
+        once after the last batch.
+        
+        Args:
+            normalized: Normalized product dictionaries
+        
+        Returns:
+            Number of rows stored
+        """
+        # Bulk ingest tuning for this transaction only: the load can always be
+        # re-run from the downloaded file, so don't wait on the WAL flush at commit
+        await self.db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+        
+        return await self.store_normalized_data(normalized)
+    
+    @staticmethod
+    def _extract_pricing(sku_terms: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Extract pricing from terms section.
+        Extract pricing from a SKU's OnDemand terms.
         
         Args:
-            sku: Product SKU
-            terms: Terms section from pricing JSON
+            sku_terms: OnDemand terms for one SKU (terms["OnDemand"][sku])
         
         Returns:
             Dictionary with price_per_unit, unit, currency
         """
-        # Get OnDemand pricing
-        on_demand = terms.get("OnDemand", {})
-        sku_terms = on_demand.get(sku, {})
+        # AWS OnDemand terms almost always hold exactly one term with one
+        # dimension, so take the first directly instead of walking items()
+        term_data = next(iter(sku_terms.values()), None)
+        if term_data is None:
+            return {}
         
-        for term_code, term_data in sku_terms.items():
-            price_dimensions = term_data.get("priceDimensions", {})
+        price_dimensions = term_data.get("priceDimensions", {})
+        dimension = next(iter(price_dimensions.values()), None)
+        if dimension is not None:
+            price_per_unit = dimension.get("pricePerUnit", {}).get("USD")
             
-            for dimension_code, dimension in price_dimensions.items():
+            if price_per_unit is not None:
+                return {
+                    "price_per_unit": Decimal(str(price_per_unit)),
+                    "unit": dimension.get("unit", ""),
+                    "currency": "USD"
+                }
+        
+        # Rare multi-term / multi-dimension SKU: fall back to a full scan
+        for term_data in sku_terms.values():
+            for dimension in term_data.get("priceDimensions", {}).values():
                 price_per_unit = dimension.get("pricePerUnit", {}).get("USD")
                 
                 if price_per_unit is not None:
@@ -179,6 +552,139 @@ class BasePricingNormalizer(ABC):
         
         return {}
     
+    async def _bulk_upsert(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        conflict_columns: Tuple[str, ...],
+        update_columns: Tuple[str, ...],
+        rows: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Upsert rows in bulk.
+        
+        On asyncpg the rows are streamed with COPY into a temp staging table
+        and merged with one INSERT ... SELECT (see _copy_upsert). Other drivers
+        use multi-row VALUES statements, each carrying as many rows as fit
+        under the bind parameter limit.
+        
+        CRITICAL: A single INSERT ... ON CONFLICT DO UPDATE cannot touch the
+        same key twice, so rows are deduplicated on conflict_columns first
+        (last row wins, matching the old row-by-row upsert).
+        
+        Args:
+            table: Target table
+            columns: Inserted columns (every row must have all of them)
+            conflict_columns: Unique constraint columns for ON CONFLICT
+            update_columns: Columns overwritten on conflict
+            rows: Row dictionaries (any iterable; consumed once)
+        
+        Returns:
+            Number of rows written
+        """
+        unique_rows = list({
+            tuple(row[col] for col in conflict_columns): row for row in rows
+        }.values())
+        
+        if not unique_rows:
+            return 0
+        
+        if self.db.get_bind().dialect.driver == "asyncpg":
+            await self._copy_upsert(
+                table, columns, conflict_columns, update_columns, unique_rows
+            )
+            return len(unique_rows)
+        
+        rows_per_statement = MAX_BIND_PARAMS // len(columns)
+        
+        start = 0
+        for size in _statement_row_counts(len(unique_rows), rows_per_statement):
+            batch = unique_rows[start:start + size]
+            start += size
+            
+            params = {}
+            for i, row in enumerate(batch):
+                for col in columns:
+                    params[f"{col}_{i}"] = row[col]
+            
+            statement = _build_multirow_upsert(
+                table, columns, conflict_columns, update_columns, len(batch)
+            )
+            await self.db.execute(statement, params)
+        
+        return len(unique_rows)
+    
+    async def _copy_upsert(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        conflict_columns: Tuple[str, ...],
+        update_columns: Tuple[str, ...],
+        unique_rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Upsert deduplicated rows through a COPY-loaded staging table.
+        
+        COPY skips per-statement parse/plan and bind handling entirely, but
+        cannot resolve conflicts itself, so rows land in a temp table first
+        and are merged into the target with ON CONFLICT.
+        
+        CRITICAL: The staging table is created with CREATE TABLE AS ... WITH
+        NO DATA so it carries only the column types - no NOT NULL on id and
+        no serial default that would burn target sequence values.
+        
+        Args:
+            table: Target table
+            columns: Inserted columns
+            conflict_columns: Unique constraint columns for ON CONFLICT
+            update_columns: Columns overwritten on conflict
+            unique_rows: Rows already deduplicated on conflict_columns
+        """
+        staging_table = f"{table}_staging"
+        
+        # CRITICAL: Create through the session. SQLAlchemy's asyncpg adapter
+        # only opens the transaction on its first cursor execute; a raw
+        # driver call first would run in autocommit and ON COMMIT DROP the
+        # staging table before the COPY
+        await self.db.execute(text(
+            f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM {table} WITH NO DATA"
+        ))
+        
+        # COPY and merge go straight to the asyncpg connection inside that
+        # transaction: three round trips (create, COPY, merge + drop) per batch
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        
+        await driver.copy_records_to_table(
+            staging_table,
+            records=[tuple(row[col] for col in columns) for row in unique_rows],
+            columns=list(columns)
+        )
+        await driver.execute(_build_staged_merge(
+            table, staging_table, columns, conflict_columns, update_columns
+        ))
+    
+    def _normalize_region(self, location: str) -> str:
+        """
+        Convert AWS location to region code.
+        
+        Args:
+            location: AWS location string (e.g., "US East (N. Virginia)")
+        
+        Returns:
+            Region code (e.g., "us-east-1")
+        
+        Raises:
+            NormalizationError: If the location is not mapped
+        """
+        region = self.location_map.get(location)
+        if not region:
+            raise NormalizationError(f"Unknown location: {location}")
+        
+        return region
+    
     def _validate_required_attributes(self, attributes: Dict[str, Any]) -> None:
         """
         Validate that all required attributes are present.
@@ -189,10 +695,18 @@ class BasePricingNormalizer(ABC):
         Raises:
             NormalizationError: If required attributes missing
         """
-        missing = []
-        for attr in self.required_attributes:
-            if attr not in attributes or attributes[attr] is None:
-                missing.append(attr)
+        required = self._required_attribute_set
+        
+        # Common case: a C-level subset test plus one pass over the values
+        if required <= attributes.keys() and all(
+            attributes[attr] is not None for attr in required
+        ):
+            return
+        
+        missing = [
+            attr for attr in self.required_attributes
+            if attributes.get(attr) is None
+        ]
         
         if missing:
             raise NormalizationError(
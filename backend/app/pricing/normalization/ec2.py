@@ -3,14 +3,42 @@ EC2 pricing normalizer.
 Converts raw AWS EC2 pricing JSON into deterministic relational rows.
 """
 import logging
+from operator import itemgetter
 from typing import Dict, List, Any
 from decimal import Decimal
-from sqlalchemy import text
 
-from app.pricing.normalization.base import BasePricingNormalizer, NormalizationError
+from app.pricing.normalization.base import (
+    LOCATION_REGION_MAP,
+    BasePricingNormalizer,
+    NormalizationError,
+    extract_attributes
+)
 
 logger = logging.getLogger(__name__)
 
+# pricing_ec2 upsert shape (conflict columns match its unique constraint)
+EC2_COLUMNS = (
+    "version_id", "sku", "instance_type", "operating_system", "tenancy",
+    "capacity_status", "pre_installed_sw", "region", "price_per_unit", "unit",
+    "currency",
+)
+EC2_CONFLICT_COLUMNS = (
+    "version_id", "instance_type", "operating_system", "tenancy", "region",
+    "capacity_status",
+)
+EC2_UPDATE_COLUMNS = ("price_per_unit", "unit")
+
+# Product attributes read per SKU, with defaults for products that omit them
+EC2_ATTRIBUTE_DEFAULTS = {
+    "instanceType": None,
+    "operatingSystem": None,
+    "tenancy": None,
+    "capacitystatus": "Used",
+    "preInstalledSw": "NA",
+    "location": None,
+}
+_get_ec2_attributes = itemgetter(*EC2_ATTRIBUTE_DEFAULTS)
+
 
 class EC2PricingNormalizer(BasePricingNormalizer):
     """
@@ -25,6 +53,10 @@ class EC2PricingNormalizer(BasePricingNormalizer):
     - region
     """
     
+    product_families = frozenset({"Compute Instance", "Compute Instance (bare metal)"})
+    
+    location_map = {**LOCATION_REGION_MAP, "Asia Pacific (Osaka)": "ap-northeast-3"}
+    
     @property
     def service_code(self) -> str:
         return "AmazonEC2"
@@ -51,17 +83,22 @@ class EC2PricingNormalizer(BasePricingNormalizer):
         Raises:
             NormalizationError: If required attributes missing
         """
-        attributes = product.get("attributes", {})
+        (
+            instance_type, operating_system, tenancy,
+            capacity_status, pre_installed_sw, location
+        ) = extract_attributes(
+            product.get("attributes", {}), _get_ec2_attributes, EC2_ATTRIBUTE_DEFAULTS
+        )
         
         # Extract required attributes
         normalized = {
             "sku": product.get("sku"),
-            "instance_type": attributes.get("instanceType"),
-            "operating_system": attributes.get("operatingSystem"),
-            "tenancy": attributes.get("tenancy"),
-            "capacity_status": attributes.get("capacitystatus", "Used"),
-            "pre_installed_sw": attributes.get("preInstalledSw", "NA"),
-            "region": self._normalize_region(attributes.get("location"))
+            "instance_type": instance_type,
+            "operating_system": operating_system,
+            "tenancy": tenancy,
+            "capacity_status": capacity_status,
+            "pre_installed_sw": pre_installed_sw,
+            "region": self._normalize_region(location)
         }
         
         # Validate required attributes
@@ -82,27 +119,9 @@ class EC2PricingNormalizer(BasePricingNormalizer):
         if not normalized_products:
             return 0
         
-        # Build bulk insert
-        insert_sql = """
-            INSERT INTO pricing_ec2 (
-                version_id, sku, instance_type, operating_system, tenancy,
-                capacity_status, pre_installed_sw, region,
-                price_per_unit, unit, currency
-            ) VALUES (
-                :version_id, :sku, :instance_type, :operating_system, :tenancy,
-                :capacity_status, :pre_installed_sw, :region,
-                :price_per_unit, :unit, :currency
-            )
-            ON CONFLICT (version_id, instance_type, operating_system, tenancy, region, capacity_status)
-            DO UPDATE SET
-                price_per_unit = EXCLUDED.price_per_unit,
-                unit = EXCLUDED.unit
-        """
-        
-        # Prepare data
-        rows = []
-        for product in normalized_products:
-            rows.append({
+        # Fed lazily into the upsert dedup; no intermediate row list
+        rows = (
+            {
                 "version_id": self.version_id,
                 "sku": product["sku"],
                 "instance_type": product["instance_type"],
@@ -114,47 +133,13 @@ class EC2PricingNormalizer(BasePricingNormalizer):
                 "price_per_unit": product["price_per_unit"],
                 "unit": product["unit"],
                 "currency": product["currency"]
-            })
-        
-        # Execute bulk insert
-        await self.db.execute(text(insert_sql), rows)
-        await self.db.commit()
-        
-        logger.info(f"Inserted {len(rows)} EC2 pricing rows")
-        return len(rows)
-    
-    def _normalize_region(self, location: str) -> str:
-        """
-        Convert AWS location to region code.
-        
-        Args:
-            location: AWS location string (e.g., "US East (N. Virginia)")
-        
-        Returns:
-            Region code (e.g., "us-east-1")
-        """
-        # Mapping of location strings to region codes
-        location_map = {
-            "US East (N. Virginia)": "us-east-1",
-            "US East (Ohio)": "us-east-2",
-            "US West (N. California)": "us-west-1",
-            "US West (Oregon)": "us-west-2",
-            "EU (Ireland)": "eu-west-1",
-            "EU (London)": "eu-west-2",
-            "EU (Paris)": "eu-west-3",
-            "EU (Frankfurt)": "eu-central-1",
-            "Asia Pacific (Mumbai)": "ap-south-1",
-            "Asia Pacific (Singapore)": "ap-southeast-1",
-            "Asia Pacific (Sydney)": "ap-southeast-2",
-            "Asia Pacific (Tokyo)": "ap-northeast-1",
-            "Asia Pacific (Seoul)": "ap-northeast-2",
-            "Asia Pacific (Osaka)": "ap-northeast-3",
-            "Canada (Central)": "ca-central-1",
-            "South America (São Paulo)": "sa-east-1"
-        }
+            }
+            for product in normalized_products
+        )
         
-        region = location_map.get(location)
-        if not region:
-            raise NormalizationError(f"Unknown location: {location}")
+        count = await self._bulk_upsert(
+            "pricing_ec2", EC2_COLUMNS, EC2_CONFLICT_COLUMNS, EC2_UPDATE_COLUMNS, rows
+        )
         
-        return region
+        logger.info(f"Inserted {count} EC2 pricing rows")
+        return count
@@ -4,12 +4,19 @@ Converts raw AWS Lambda pricing JSON into deterministic relational rows.
 """
 import logging
 from typing import Dict, List, Any
-from sqlalchemy import text
 
-from app.pricing.normalization.base import BasePricingNormalizer, NormalizationError
+from app.pricing.normalization.base import BasePricingNormalizer
 
 logger = logging.getLogger(__name__)
 
+# pricing_lambda upsert shape (conflict columns match its unique constraint)
+LAMBDA_COLUMNS = (
+    "version_id", "sku", "group_description", "region", "price_per_unit",
+    "unit", "currency",
+)
+LAMBDA_CONFLICT_COLUMNS = ("version_id", "group_description", "region")
+LAMBDA_UPDATE_COLUMNS = ("price_per_unit",)
+
 
 class LambdaPricingNormalizer(BasePricingNormalizer):
     """Lambda-specific pricing normalizer."""
@@ -40,21 +47,9 @@ class LambdaPricingNormalizer(BasePricingNormalizer):
         if not normalized_products:
             return 0
         
-        insert_sql = """
-            INSERT INTO pricing_lambda (
-                version_id, sku, group_description, region,
-                price_per_unit, unit, currency
-            ) VALUES (
-                :version_id, :sku, :group_description, :region,
-                :price_per_unit, :unit, :currency
-            )
-            ON CONFLICT (version_id, group_description, region)
-            DO UPDATE SET price_per_unit = EXCLUDED.price_per_unit
-        """
-        
-        rows = []
-        for product in normalized_products:
-            rows.append({
+        # Fed lazily into the upsert dedup; no intermediate row list
+        rows = (
+            {
                 "version_id": self.version_id,
                 "sku": product["sku"],
                 "group_description": product["group_description"],
@@ -62,35 +57,13 @@ class LambdaPricingNormalizer(BasePricingNormalizer):
                 "price_per_unit": product["price_per_unit"],
                 "unit": product["unit"],
                 "currency": product["currency"]
-            })
-        
-        await self.db.execute(text(insert_sql), rows)
-        await self.db.commit()
+            }
+            for product in normalized_products
+        )
         
-        logger.info(f"Inserted {len(rows)} Lambda pricing rows")
-        return len(rows)
-    
-    def _normalize_region(self, location: str) -> str:
-        """Convert AWS location to region code."""
-        location_map = {
-            "US East (N. Virginia)": "us-east-1",
-            "US East (Ohio)": "us-east-2",
-            "US West (N. California)": "us-west-1",
-            "US West (Oregon)": "us-west-2",
-            "EU (Ireland)": "eu-west-1",
-            "EU (London)": "eu-west-2",
-            "EU (Paris)": "eu-west-3",
-            "EU (Frankfurt)": "eu-central-1",
-            "Asia Pacific (Mumbai)": "ap-south-1",
-            "Asia Pacific (Singapore)": "ap-southeast-1",
-            "Asia Pacific (Sydney)": "ap-southeast-2",
-            "Asia Pacific (Tokyo)": "ap-northeast-1",
-            "Asia Pacific (Seoul)": "ap-northeast-2",
-            "Canada (Central)": "ca-central-1",
-            "South America (São Paulo)": "sa-east-1"
-        }
+        count = await self._bulk_upsert(
+            "pricing_lambda", LAMBDA_COLUMNS, LAMBDA_CONFLICT_COLUMNS, LAMBDA_UPDATE_COLUMNS, rows
+        )
         
-        region = location_map.get(location)
-        if not region:
-            raise NormalizationError(f"Unknown location: {location}")
-        return region
+        logger.info(f"Inserted {count} Lambda pricing rows")
+        return count
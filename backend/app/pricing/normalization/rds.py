@@ -3,17 +3,45 @@ RDS pricing normalizer.
 Converts raw AWS RDS pricing JSON into deterministic relational rows.
 """
 import logging
+from operator import itemgetter
 from typing import Dict, List, Any
-from sqlalchemy import text
 
-from app.pricing.normalization.base import BasePricingNormalizer, NormalizationError
+from app.pricing.normalization.base import (
+    BasePricingNormalizer,
+    extract_attributes
+)
 
 logger = logging.getLogger(__name__)
 
+# pricing_rds upsert shape (conflict columns match its unique constraint)
+RDS_COLUMNS = (
+    "version_id", "sku", "instance_class", "database_engine",
+    "deployment_option", "database_edition", "license_model", "region",
+    "price_per_unit", "unit", "currency",
+)
+RDS_CONFLICT_COLUMNS = (
+    "version_id", "instance_class", "database_engine", "deployment_option",
+    "region",
+)
+RDS_UPDATE_COLUMNS = ("price_per_unit",)
+
+# Product attributes read per SKU, with defaults for products that omit them
+RDS_ATTRIBUTE_DEFAULTS = {
+    "instanceType": None,
+    "databaseEngine": None,
+    "deploymentOption": "Single-AZ",
+    "databaseEdition": None,
+    "licenseModel": None,
+    "location": None,
+}
+_get_rds_attributes = itemgetter(*RDS_ATTRIBUTE_DEFAULTS)
+
 
 class RDSPricingNormalizer(BasePricingNormalizer):
     """RDS-specific pricing normalizer."""
     
+    product_families = frozenset({"Database Instance"})
+    
     @property
     def service_code(self) -> str:
         return "AmazonRDS"
@@ -29,16 +57,21 @@ class RDSPricingNormalizer(BasePricingNormalizer):
     
     async def normalize_product(self, product: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize RDS product."""
-        attributes = product.get("attributes", {})
+        (
+            instance_class, database_engine, deployment_option,
+            database_edition, license_model, location
+        ) = extract_attributes(
+            product.get("attributes", {}), _get_rds_attributes, RDS_ATTRIBUTE_DEFAULTS
+        )
         
         normalized = {
             "sku": product.get("sku"),
-            "instance_class": attributes.get("instanceType"),
-            "database_engine": attributes.get("databaseEngine"),
-            "deployment_option": attributes.get("deploymentOption", "Single-AZ"),
-            "database_edition": attributes.get("databaseEdition"),
-            "license_model": attributes.get("licenseModel"),
-            "region": self._normalize_region(attributes.get("location"))
+            "instance_class": instance_class,
+            "database_engine": database_engine,
+            "deployment_option": deployment_option,
+            "database_edition": database_edition,
+            "license_model": license_model,
+            "region": self._normalize_region(location)
         }
         
         self._validate_required_attributes(normalized)
@@ -49,23 +82,9 @@ class RDSPricingNormalizer(BasePricingNormalizer):
         if not normalized_products:
             return 0
         
-        insert_sql = """
-            INSERT INTO pricing_rds (
-                version_id, sku, instance_class, database_engine, deployment_option,
-                database_edition, license_model, region,
-                price_per_unit, unit, currency
-            ) VALUES (
-                :version_id, :sku, :instance_class, :database_engine, :deployment_option,
-                :database_edition, :license_model, :region,
-                :price_per_unit, :unit, :currency
-            )
-            ON CONFLICT (version_id, instance_class, database_engine, deployment_option, region)
-            DO UPDATE SET price_per_unit = EXCLUDED.price_per_unit
-        """
-        
-        rows = []
-        for product in normalized_products:
-            rows.append({
+        # Fed lazily into the upsert dedup; no intermediate row list
+        rows = (
+            {
                 "version_id": self.version_id,
                 "sku": product["sku"],
                 "instance_class": product["instance_class"],
@@ -77,35 +96,13 @@ class RDSPricingNormalizer(BasePricingNormalizer):
                 "price_per_unit": product["price_per_unit"],
                 "unit": product["unit"],
                 "currency": product["currency"]
-            })
+            }
+            for product in normalized_products
+        )
         
-        await self.db.execute(text(insert_sql), rows)
-        await self.db.commit()
-        
-        logger.info(f"Inserted {len(rows)} RDS pricing rows")
-        return len(rows)
-    
-    def _normalize_region(self, location: str) -> str:
-        """Convert AWS location to region code."""
-        location_map = {
-            "US East (N. Virginia)": "us-east-1",
-            "US East (Ohio)": "us-east-2",
-            "US West (N. California)": "us-west-1",
-            "US West (Oregon)": "us-west-2",
-            "EU (Ireland)": "eu-west-1",
-            "EU (London)": "eu-west-2",
-            "EU (Paris)": "eu-west-3",
-            "EU (Frankfurt)": "eu-central-1",
-            "Asia Pacific (Mumbai)": "ap-south-1",
-            "Asia Pacific (Singapore)": "ap-southeast-1",
-            "Asia Pacific (Sydney)": "ap-southeast-2",
-            "Asia Pacific (Tokyo)": "ap-northeast-1",
-            "Asia Pacific (Seoul)": "ap-northeast-2",
-            "Canada (Central)": "ca-central-1",
-            "South America (São Paulo)": "sa-east-1"
-        }
+        count = await self._bulk_upsert(
+            "pricing_rds", RDS_COLUMNS, RDS_CONFLICT_COLUMNS, RDS_UPDATE_COLUMNS, rows
+        )
         
-        region = location_map.get(location)
-        if not region:
-            raise NormalizationError(f"Unknown location: {location}")
-        return region
+        logger.info(f"Inserted {count} RDS pricing rows")
+        return count
@@ -9,8 +9,10 @@ from apscheduler.triggers.cron import CronTrigger
 
 from app.config import settings
 from app.db.database import get_sync_session
+from app.pricing.async_adapters.base import clear_pricing_rule_cache
 from app.pricing.ingestion import download_pricing_data
 from app.pricing.normalization import normalize_pricing_data
+from app.pricing.version_manager import clear_active_version_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,9 @@ class PricingScheduler:
             logger.info("Downloading pricing data from AWS")
             pricing_files = download_pricing_data()
             
+            # Empty when downloads failed (already logged) or nothing changed
             if not pricing_files:
-                logger.warning("No pricing files downloaded")
+                logger.info("No new pricing files to normalize")
                 return
             
             logger.info(f"Downloaded {len(pricing_files)} pricing files")
@@ -46,6 +49,14 @@ class PricingScheduler:
                 version = normalize_pricing_data(db, pricing_files)
                 logger.info(f"Created pricing version: {version.version}")
             
+            # Reloaded data may change the service catalog, stats, active version
+            # and matched pricing rules served by the API
+            from app.api.pricing import clear_pricing_services_cache, clear_pricing_stats_cache
+            clear_pricing_services_cache()
+            clear_pricing_stats_cache()
+            clear_active_version_cache()
+            clear_pricing_rule_cache()
+            
             logger.info("Pricing update completed successfully")
         
         except Exception as e:
@@ -2,11 +2,14 @@
 Pricing version state management.
 Enforces strict state transitions and single active version constraint.
 """
+import asyncio
 import logging
+import time
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from sqlalchemy.exc import IntegrityError
 
@@ -38,6 +41,61 @@ class MultipleActiveVersionsError(Exception):
     pass
 
 
+# Active pricing version shared by all analysis requests. The active version
+# only changes through this module (activate/archive clear the cache), so one
+# lookup per TTL window is enough; the TTL bounds staleness when another
+# process activates a version. The lock makes concurrent requests on a cold
+# cache wait for a single query instead of each issuing their own.
+_ACTIVE_VERSION_TTL_SECONDS = 300.0
+_active_version_cache: Optional[PricingVersion] = None
+_active_version_expiry: float = 0.0
+_active_version_lock = asyncio.Lock()
+
+
+def clear_active_version_cache() -> None:
+    """Drop the cached active pricing version so the next request re-reads it."""
+    global _active_version_cache, _active_version_expiry
+    _active_version_cache = None
+    _active_version_expiry = 0.0
+
+
+async def get_cached_active_version(db: AsyncSession) -> Optional[PricingVersion]:
+    """
+    Get the ACTIVE pricing version, cached for _ACTIVE_VERSION_TTL_SECONDS.
+    
+    Sessions are created with expire_on_commit=False, so the cached instance
+    keeps its loaded attributes after the session that read it is closed.
+    
+    Args:
+        db: Database session used on a cache miss
+    
+    Returns:
+        Active version or None if no active version exists
+    """
+    global _active_version_cache, _active_version_expiry
+    
+    if _active_version_cache is not None and time.monotonic() < _active_version_expiry:
+        return _active_version_cache
+    
+    async with _active_version_lock:
+        # Another request may have refreshed the cache while we waited
+        if _active_version_cache is not None and time.monotonic() < _active_version_expiry:
+            return _active_version_cache
+        
+        result = await db.execute(
+            select(PricingVersion)
+            .where(PricingVersion.status == VersionStatus.ACTIVE)
+        )
+        version = result.scalar_one_or_none()
+        
+        # Don't pin a miss: a version may be activated at any time
+        if version is not None:
+            _active_version_cache = version
+            _active_version_expiry = time.monotonic() + _ACTIVE_VERSION_TTL_SECONDS
+        
+        return version
+
+
 class PricingVersionManager:
     """
     Manages pricing version lifecycle with atomic state transitions.
@@ -118,23 +176,23 @@ class PricingVersionManager:
         # Perform validation checks
         errors = []
         
-        # Check dimension count
-        dimension_count = self.db.execute(
-            select(func.count(PricingDimension.id))
+        # Dimension and distinct service counts in one scan of the
+        # version's rows (one round-trip instead of two)
+        dimension_count, service_count = self.db.execute(
+            select(
+                func.count(PricingDimension.id),
+                func.count(func.distinct(PricingDimension.service_id))
+            )
             .where(PricingDimension.version_id == version_id)
-        ).scalar()
+        ).one()
         
+        # Check dimension count
         if dimension_count < min_dimensions:
             errors.append(
                 f"Insufficient pricing dimensions: {dimension_count} < {min_dimensions}"
             )
         
         # Check for required services
-        service_count = self.db.execute(
-            select(func.count(func.distinct(PricingDimension.service_code)))
-            .where(PricingDimension.version_id == version_id)
-        ).scalar()
-        
         if service_count == 0:
             errors.append("No services found in pricing data")
         
@@ -240,6 +298,9 @@ class PricingVersionManager:
             self.db.commit()
             self.db.refresh(version)
             
+            # CRITICAL: The previous ACTIVE version was just archived
+            clear_active_version_cache()
+            
             logger.info(f"Activated version {version_id}")
             return version
         
@@ -287,6 +348,7 @@ class PricingVersionManager:
         
         self.db.commit()
         self.db.refresh(version)
+        clear_active_version_cache()
         
         logger.info(f"Archived version {version_id}")
         return version
@@ -4,7 +4,6 @@ Handles conditional resource creation and attribute assignment.
 """
 import logging
 from typing import Dict, List, Any, Optional
-from copy import deepcopy
 
 from app.terraform.evaluator.expression_eval import ExpressionEvaluator
 from app.terraform.evaluator.errors import ConditionalEvaluationError
@@ -68,7 +67,8 @@ class ConditionalEvaluator:
         
         # If count evaluates to 0 or false, skip resource
         if count_value == 0 or count_value is False:
-            logger.info(f"Resource {context} skipped due to conditional count={count_value}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Resource {context} skipped due to conditional count={count_value}")
             return None
         
         return resource
@@ -150,8 +150,9 @@ class ConditionalEvaluator:
             if self.evaluate_resource_condition(resource) is None:
                 continue
             
-            # Resolve attribute conditionals
-            resolved_resource = deepcopy(resource)
+            # Resolve attribute conditionals; only "attributes" is replaced
+            # and it is rebuilt from scratch, so a shallow copy suffices
+            resolved_resource = dict(resource)
             context = f"{resource.get('type', 'unknown')}.{resource.get('name', 'unknown')}"
             
             resolved_resource["attributes"] = self.evaluate_attribute_conditionals(
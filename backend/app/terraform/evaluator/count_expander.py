@@ -4,7 +4,6 @@ Expands resources with count meta-argument into concrete instances.
 """
 import logging
 from typing import Dict, List, Any
-from copy import deepcopy
 
 from app.terraform.evaluator.expression_eval import ExpressionEvaluator
 from app.terraform.evaluator.errors import (
@@ -16,6 +15,25 @@ from app.terraform.evaluator.errors import (
 logger = logging.getLogger(__name__)
 
 
+def _references_count_index(value: Any) -> bool:
+    """
+    Check whether any string in a nested attribute value mentions count.index.
+    
+    Args:
+        value: Attribute value (scalar, dict or list)
+    
+    Returns:
+        True if count.index appears anywhere in the value
+    """
+    if isinstance(value, str):
+        return "count.index" in value
+    if isinstance(value, dict):
+        return any(_references_count_index(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_references_count_index(v) for v in value)
+    return False
+
+
 class CountExpander:
     """
     Expands Terraform resources with count meta-argument.
@@ -92,32 +110,45 @@ class CountExpander:
         
         # count = 0 means no resources
         if count_value == 0:
-            logger.info(f"Resource {context} has count=0, skipping")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Resource {context} has count=0, skipping")
             return []
         
-        # Expand into N resources
+        # Decided once for all N instances: resources that never reference
+        # count.index (e.g. count = var.enabled ? 1 : 0) skip the per-instance
+        # attribute rewrite entirely
+        uses_index = _references_count_index(attributes)
+        
+        # Remove count from attributes once (it's been processed)
+        base_attributes = {k: v for k, v in attributes.items() if k != "count"}
+        
+        # Expand into N resources. Instances are shallow copies: nested
+        # attribute values are shared and treated as read-only downstream,
+        # and _resolve_count_index rebuilds any structure it rewrites, so a
+        # deepcopy per instance is pure allocation overhead.
         expanded = []
         for index in range(count_value):
-            expanded_resource = deepcopy(resource)
+            expanded_resource = dict(resource)
             
             # Set logical ID with index
             expanded_resource["logical_id"] = f"{resource_name}[{index}]"
             expanded_resource["physical_index"] = index
             expanded_resource["count_index"] = index
             
-            # Remove count from attributes (it's been processed)
-            if "count" in expanded_resource.get("attributes", {}):
-                del expanded_resource["attributes"]["count"]
-            
             # Resolve count.index references in attributes
-            expanded_resource["attributes"] = self._resolve_count_index(
-                expanded_resource["attributes"],
-                index
-            )
+            if uses_index:
+                expanded_resource["attributes"] = self._resolve_count_index(
+                    base_attributes,
+                    index
+                )
+            else:
+                expanded_resource["attributes"] = dict(base_attributes)
             
             expanded.append(expanded_resource)
         
-        logger.info(f"Expanded {context} with count={count_value} into {len(expanded)} resources")
+        # Logged once per resource: don't format the message when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Expanded {context} with count={count_value} into {len(expanded)} resources")
         return expanded
     
     def _resolve_count_index(self, attributes: Dict[str, Any], index: int) -> Dict[str, Any]:
@@ -29,6 +29,15 @@ class ExpandedResource:
     - resolved_region: Concrete AWS region
     """
     
+    # One instance per expanded resource; no per-instance __dict__
+    __slots__ = (
+        "logical_id",
+        "resource_type",
+        "physical_index",
+        "resolved_attributes",
+        "resolved_region",
+    )
+    
     def __init__(
         self,
         logical_id: str,
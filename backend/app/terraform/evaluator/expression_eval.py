@@ -5,7 +5,9 @@ FAILS FAST on any unresolved reference or dynamic value.
 """
 import re
 import logging
-from typing import Any, Dict, Optional
+import operator
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from decimal import Decimal
 
 from app.terraform.evaluator.errors import (
@@ -16,6 +18,130 @@ from app.terraform.evaluator.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; these run for every string attribute evaluated
+INTERPOLATION_PATTERN = re.compile(r'\$\{([^}]+)\}')
+FUNCTION_CALL_PATTERN = re.compile(r'(\w+)\((.*)\)$')
+NUMERIC_LITERAL_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Keyword literals and their values
+LITERAL_VALUES = {"true": True, "false": False, "null": None}
+
+# Expression results memoized per evaluator. Variables and locals are fixed
+# for an evaluator's lifetime, so an expression always yields the same value;
+# only immutable results are cached so callers can't alias a shared list/map.
+EXPRESSION_CACHE_SIZE = 4096
+_CACHEABLE_RESULT_TYPES = (str, int, float, bool, type(None))
+_MISSING = object()
+
+# Operator token -> implementation, so evaluation is one lookup and a call
+COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+}
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _classify_expression(expr: str) -> Tuple[str, Any]:
+    """
+    Decide once how a (stripped) expression is evaluated.
+    
+    The checks mirror Terraform-subset precedence: literals, references,
+    ternary, logical, comparison, arithmetic, then function calls. They only
+    look at the expression text, so the decision is cached and shared by every
+    evaluator instead of re-running the substring scans per evaluation.
+    
+    Args:
+        expr: Stripped expression text
+    
+    Returns:
+        (kind, argument): literal value, reference name or operator token
+    """
+    # Constants (operands of nearly every arithmetic/comparison split)
+    if expr in LITERAL_VALUES:
+        return "literal", LITERAL_VALUES[expr]
+    if NUMERIC_LITERAL_PATTERN.fullmatch(expr):
+        return "literal", float(expr) if "." in expr else int(expr)
+    
+    if expr.startswith("var."):
+        return "var", expr[4:]
+    if expr.startswith("local."):
+        return "local", expr[6:]
+    if expr.startswith(("data.", "resource.", "module.")):
+        return "dynamic", None
+    
+    # Ternary operator: condition ? true_val : false_val
+    if "?" in expr and ":" in expr:
+        return "ternary", None
+    
+    # Logical operators
+    if "||" in expr:
+        return "or", None
+    if "&&" in expr:
+        return "and", None
+    
+    # Comparison operators
+    for op in ("==", "!=", "<=", ">=", "<", ">"):
+        if op in expr:
+            return "comparison", op
+    
+    # Arithmetic operators (a leading "-" is a negative number, not subtraction)
+    if not expr.startswith("-"):
+        for op in ("+", "-", "*", "/", "%"):
+            if op in expr:
+                return "arithmetic", op
+    
+    # Function calls
+    if "(" in expr and expr.endswith(")"):
+        return "function", None
+    
+    # Numeric literal not caught above (e.g. exponent form)
+    try:
+        return "literal", float(expr) if "." in expr else int(expr)
+    except ValueError:
+        pass
+    
+    # String literal (quoted)
+    if (expr.startswith('"') and expr.endswith('"')) or \
+       (expr.startswith("'") and expr.endswith("'")):
+        return "literal", expr[1:-1]
+    
+    return "invalid", None
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _parse_template(value: str) -> Tuple[Tuple[Tuple[str, str], ...], str]:
+    """
+    Split an interpolated string into its literal and expression parts.
+    
+    Parsing depends only on the string, so the split is shared by every
+    evaluator and every resource using the same template.
+    
+    Args:
+        value: String possibly containing ${...} interpolations
+    
+    Returns:
+        ((literal_before, stripped_expression), ...) and the trailing literal
+    """
+    parts = []
+    position = 0
+    
+    for match in INTERPOLATION_PATTERN.finditer(value):
+        parts.append((value[position:match.start()], match.group(1).strip()))
+        position = match.end()
+    
+    return tuple(parts), value[position:]
+
 
 class ExpressionEvaluator:
     """
@@ -37,6 +163,10 @@ class ExpressionEvaluator:
     - Provider-specific functions
     """
     
+    # Fixed attribute layout: variables/locals/caches are read on every
+    # expression, and slot access skips the per-instance __dict__ lookup
+    __slots__ = ("variables", "locals", "_expression_cache", "_template_cache")
+    
     def __init__(self, variables: Dict[str, Any], locals_dict: Dict[str, Any]):
         """
         Initialize evaluator with resolved variables and locals.
@@ -47,6 +177,13 @@ class ExpressionEvaluator:
         """
         self.variables = variables or {}
         self.locals = locals_dict or {}
+        self._expression_cache: Dict[str, Any] = {}
+        self._template_cache: Dict[str, str] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget memoized expression results (call after changing variables/locals)."""
+        self._expression_cache.clear()
+        self._template_cache.clear()
     
     def evaluate(self, expression: Any, context: str = "") -> Any:
         """
@@ -84,97 +221,89 @@ class ExpressionEvaluator:
     
     def _evaluate_string(self, value: str, context: str) -> Any:
         """Evaluate a string expression."""
-        # Check for interpolation: ${...}
-        interpolation_pattern = r'\$\{([^}]+)\}'
-        matches = list(re.finditer(interpolation_pattern, value))
+        # Most attribute values are plain strings; skip the regex scan
+        if "${" not in value:
+            return value
+        
+        parts, tail = _parse_template(value)
         
-        if not matches:
+        if not parts:
             # Plain string
             return value
         
         # If entire string is a single interpolation, return the evaluated value
-        if len(matches) == 1 and matches[0].group(0) == value:
-            expr = matches[0].group(1).strip()
-            return self._evaluate_expression(expr, context)
+        if len(parts) == 1 and not parts[0][0] and not tail:
+            return self._evaluate_expression(parts[0][1], context)
+        
+        # Multiple interpolations or mixed - build result string (always a
+        # str, so identical templates across resources share one result)
+        cache = self._template_cache
+        result = cache.get(value)
+        if result is not None:
+            return result
         
-        # Multiple interpolations or mixed - build result string
-        result = value
-        for match in reversed(matches):  # Reverse to maintain positions
-            expr = match.group(1).strip()
-            evaluated = self._evaluate_expression(expr, context)
-            result = result[:match.start()] + str(evaluated) + result[match.end():]
+        result = "".join(
+            literal + str(self._evaluate_expression(expr, context))
+            for literal, expr in parts
+        ) + tail
+        
+        if len(cache) < EXPRESSION_CACHE_SIZE:
+            cache[value] = result
         
         return result
     
     def _evaluate_expression(self, expr: str, context: str) -> Any:
-        """Evaluate a Terraform expression."""
+        """Evaluate a Terraform expression, reusing earlier results."""
         expr = expr.strip()
         
+        cache = self._expression_cache
+        value = cache.get(expr, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        value = self._compute_expression(expr, context)
+        
+        if isinstance(value, _CACHEABLE_RESULT_TYPES) and len(cache) < EXPRESSION_CACHE_SIZE:
+            cache[expr] = value
+        
+        return value
+    
+    def _compute_expression(self, expr: str, context: str) -> Any:
+        """Evaluate a (stripped) Terraform expression."""
+        kind, arg = _classify_expression(expr)
+        
+        if kind == "literal":
+            return arg
+        
         # Variable reference: var.name
-        if expr.startswith("var."):
-            var_name = expr[4:]
-            if var_name not in self.variables:
+        if kind == "var":
+            if arg not in self.variables:
                 raise UnresolvedReferenceError(expr, context)
-            return self.variables[var_name]
+            return self.variables[arg]
         
         # Local reference: local.name
-        if expr.startswith("local."):
-            local_name = expr[6:]
-            if local_name not in self.locals:
+        if kind == "local":
+            if arg not in self.locals:
                 raise UnresolvedReferenceError(expr, context)
-            return self.locals[local_name]
+            return self.locals[arg]
         
         # Resource/data references - NOT SUPPORTED
-        if expr.startswith(("data.", "resource.", "module.")):
+        if kind == "dynamic":
             raise DynamicValueError("resource reference", context)
         
-        # Ternary operator: condition ? true_val : false_val
-        if "?" in expr and ":" in expr:
+        if kind == "ternary":
             return self._evaluate_ternary(expr, context)
-        
-        # Logical operators
-        if "||" in expr:
+        if kind == "or":
             return self._evaluate_logical_or(expr, context)
-        if "&&" in expr:
+        if kind == "and":
             return self._evaluate_logical_and(expr, context)
-        
-        # Comparison operators
-        for op in ["==", "!=", "<=", ">=", "<", ">"]:
-            if op in expr:
-                return self._evaluate_comparison(expr, op, context)
-        
-        # Arithmetic operators
-        for op in ["+", "-", "*", "/", "%"]:
-            if op in expr and not expr.startswith("-"):  # Avoid negative numbers
-                return self._evaluate_arithmetic(expr, op, context)
-        
-        # Function calls
-        if "(" in expr and expr.endswith(")"):
+        if kind == "comparison":
+            return self._evaluate_comparison(expr, arg, context)
+        if kind == "arithmetic":
+            return self._evaluate_arithmetic(expr, arg, context)
+        if kind == "function":
             return self._evaluate_function(expr, context)
         
-        # Boolean literals
-        if expr == "true":
-            return True
-        if expr == "false":
-            return False
-        
-        # Null literal
-        if expr == "null":
-            return None
-        
-        # Numeric literal
-        try:
-            if "." in expr:
-                return float(expr)
-            return int(expr)
-        except ValueError:
-            pass
-        
-        # String literal (quoted)
-        if (expr.startswith('"') and expr.endswith('"')) or \
-           (expr.startswith("'") and expr.endswith("'")):
-            return expr[1:-1]
-        
         raise InvalidExpressionError(expr, "Unknown expression type")
     
     def _evaluate_ternary(self, expr: str, context: str) -> Any:
@@ -221,23 +350,14 @@ class ExpressionEvaluator:
         if len(parts) != 2:
             raise InvalidExpressionError(expr, f"Invalid {op} syntax")
         
+        compare = COMPARISON_OPERATORS.get(op)
+        if compare is None:
+            raise InvalidExpressionError(expr, f"Unknown operator {op}")
+        
         left = self._evaluate_expression(parts[0].strip(), context)
         right = self._evaluate_expression(parts[1].strip(), context)
         
-        if op == "==":
-            return left == right
-        elif op == "!=":
-            return left != right
-        elif op == "<":
-            return left < right
-        elif op == ">":
-            return left > right
-        elif op == "<=":
-            return left <= right
-        elif op == ">=":
-            return left >= right
-        
-        raise InvalidExpressionError(expr, f"Unknown operator {op}")
+        return compare(left, right)
     
     def _evaluate_arithmetic(self, expr: str, op: str, context: str) -> float:
         """Evaluate arithmetic operator."""
@@ -256,24 +376,18 @@ class ExpressionEvaluator:
         except (ValueError, TypeError):
             raise InvalidExpressionError(expr, "Non-numeric operands")
         
-        if op == "+":
-            return left_num + right_num
-        elif op == "-":
-            return left_num - right_num
-        elif op == "*":
-            return left_num * right_num
-        elif op == "/":
-            if right_num == 0:
-                raise InvalidExpressionError(expr, "Division by zero")
-            return left_num / right_num
-        elif op == "%":
-            return left_num % right_num
-        
-        raise InvalidExpressionError(expr, f"Unknown operator {op}")
+        apply = ARITHMETIC_OPERATORS.get(op)
+        if apply is None:
+            raise InvalidExpressionError(expr, f"Unknown operator {op}")
+        
+        if op == "/" and right_num == 0:
+            raise InvalidExpressionError(expr, "Division by zero")
+        
+        return apply(left_num, right_num)
     
     def _evaluate_function(self, expr: str, context: str) -> Any:
         """Evaluate function call."""
-        func_match = re.match(r'(\w+)\((.*)\)$', expr)
+        func_match = FUNCTION_CALL_PATTERN.match(expr)
         if not func_match:
             raise InvalidExpressionError(expr, "Invalid function syntax")
         
@@ -4,7 +4,6 @@ Expands resources with for_each meta-argument into concrete instances.
 """
 import logging
 from typing import Dict, List, Any, Union
-from copy import deepcopy
 
 from app.terraform.evaluator.expression_eval import ExpressionEvaluator
 from app.terraform.evaluator.errors import (
@@ -16,6 +15,25 @@ from app.terraform.evaluator.errors import (
 logger = logging.getLogger(__name__)
 
 
+def _references_each(value: Any) -> bool:
+    """
+    Check whether any string in a nested attribute value mentions each.
+    
+    Args:
+        value: Attribute value (scalar, dict or list)
+    
+    Returns:
+        True if each.key / each.value may appear anywhere in the value
+    """
+    if isinstance(value, str):
+        return "each." in value
+    if isinstance(value, dict):
+        return any(_references_each(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_references_each(v) for v in value)
+    return False
+
+
 class ForEachExpander:
     """
     Expands Terraform resources with for_each meta-argument.
@@ -87,13 +105,22 @@ class ForEachExpander:
         
         # for_each with empty collection means no resources
         if len(items) == 0:
-            logger.info(f"Resource {context} has empty for_each, skipping")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Resource {context} has empty for_each, skipping")
             return []
         
-        # Expand into N resources
+        # Remove for_each from attributes once (it's been processed)
+        base_attributes = {k: v for k, v in attributes.items() if k != "for_each"}
+        
+        # Decided once for all N instances: attributes that never mention
+        # each.* skip the per-instance tree rewrite entirely
+        uses_each = _references_each(base_attributes)
+        
+        # Expand into N resources. Instances are shallow copies because
+        # _resolve_each_references rebuilds the attribute tree per instance.
         expanded = []
         for key, value in items:
-            expanded_resource = deepcopy(resource)
+            expanded_resource = dict(resource)
             
             # Set logical ID with key
             expanded_resource["logical_id"] = f"{resource_name}[\"{key}\"]"
@@ -101,20 +128,20 @@ class ForEachExpander:
             expanded_resource["for_each_key"] = key
             expanded_resource["for_each_value"] = value
             
-            # Remove for_each from attributes (it's been processed)
-            if "for_each" in expanded_resource.get("attributes", {}):
-                del expanded_resource["attributes"]["for_each"]
-            
             # Resolve each.key and each.value references in attributes
-            expanded_resource["attributes"] = self._resolve_each_references(
-                expanded_resource["attributes"],
-                key,
-                value
-            )
+            if uses_each:
+                expanded_resource["attributes"] = self._resolve_each_references(
+                    base_attributes,
+                    key,
+                    value
+                )
+            else:
+                expanded_resource["attributes"] = dict(base_attributes)
             
             expanded.append(expanded_resource)
         
-        logger.info(f"Expanded {context} with for_each into {len(expanded)} resources")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Expanded {context} with for_each into {len(expanded)} resources")
         return expanded
     
     def _extract_items(
@@ -166,22 +193,43 @@ class ForEachExpander:
         Returns:
             Attributes with each.key and each.value resolved
         """
+        # Stringified once per instance, not once per replace call
+        return self._substitute_each(attributes, str(key), str(value))
+    
+    def _substitute_each(
+        self,
+        attributes: Dict[str, Any],
+        key_str: str,
+        value_str: str
+    ) -> Dict[str, Any]:
+        """
+        Rebuild an attribute dict with each.key / each.value substituted.
+        
+        Args:
+            attributes: Resource attributes
+            key_str: Current for_each key as a string
+            value_str: Current for_each value as a string
+        
+        Returns:
+            New attribute dict; strings without "each." are kept as-is
+        """
         resolved = {}
         
         for attr_key, attr_value in attributes.items():
             if isinstance(attr_value, str):
-                # Replace each.key and each.value references
-                resolved_value = attr_value.replace("${each.key}", str(key))
-                resolved_value = resolved_value.replace("each.key", str(key))
-                resolved_value = resolved_value.replace("${each.value}", str(value))
-                resolved_value = resolved_value.replace("each.value", str(value))
-                resolved[attr_key] = resolved_value
+                if "each." in attr_value:
+                    # Replace each.key and each.value references
+                    attr_value = attr_value.replace("${each.key}", key_str)
+                    attr_value = attr_value.replace("each.key", key_str)
+                    attr_value = attr_value.replace("${each.value}", value_str)
+                    attr_value = attr_value.replace("each.value", value_str)
+                resolved[attr_key] = attr_value
             elif isinstance(attr_value, dict):
-                resolved[attr_key] = self._resolve_each_references(attr_value, key, value)
+                resolved[attr_key] = self._substitute_each(attr_value, key_str, value_str)
             elif isinstance(attr_value, list):
                 resolved[attr_key] = [
-                    self._resolve_each_references(item, key, value) if isinstance(item, dict)
-                    else item.replace("${each.key}", str(key)).replace("${each.value}", str(value))
+                    self._substitute_each(item, key_str, value_str) if isinstance(item, dict)
+                    else item.replace("${each.key}", key_str).replace("${each.value}", value_str)
                     if isinstance(item, str)
                     else item
                     for item in attr_value
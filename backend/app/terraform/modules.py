@@ -5,7 +5,6 @@ Resolves and expands local modules.
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
-from copy import deepcopy
 
 from app.terraform.parser import TerraformParser
 from app.config import settings
@@ -35,6 +34,8 @@ class ModuleResolver:
         self.max_depth = max_depth or settings.max_module_depth
         self.parser = TerraformParser()
         self.resolved_modules = {}
+        # Module paths on the current expansion path, for cycle detection
+        self._expanding = set()
     
     def is_local_module(self, source: str) -> bool:
         """
@@ -128,11 +129,40 @@ class ModuleResolver:
             # Remote module - skip
             return []
         
+        # A module that (transitively) sources itself would otherwise be
+        # re-expanded at every level until max_depth
+        if module_path in self._expanding:
+            logger.warning(f"Module cycle detected at {module_path}; not expanding again")
+            return []
+        
+        self._expanding.add(module_path)
+        try:
+            return self._expand_parsed_module(module_config, module_path, depth)
+        finally:
+            self._expanding.discard(module_path)
+    
+    def _expand_parsed_module(
+        self,
+        module_config: Dict,
+        module_path: Path,
+        depth: int
+    ) -> List[Dict]:
+        """
+        Expand a resolved module path into its resources.
+        
+        Args:
+            module_config: Module configuration
+            module_path: Resolved module directory
+            depth: Current nesting depth
+        
+        Returns:
+            List of expanded resources
+        """
         # Parse module
         try:
             parsed_module = self.parse_module(module_path)
         except Exception as e:
-            logger.error(f"Failed to parse module {source}: {e}")
+            logger.error(f"Failed to parse module {module_config.get('source')}: {e}")
             return []
         
         # Get module resources
@@ -143,8 +173,9 @@ class ModuleResolver:
         
         expanded_resources = []
         for resource in resources:
-            # Create a copy and apply module prefix
-            expanded_resource = deepcopy(resource)
+            # Create a copy and apply module prefix. Only top-level keys are
+            # set, and the parser hands back a private copy of the module
+            expanded_resource = dict(resource)
             expanded_resource["name"] = f"{module_config['name']}.{resource['name']}"
             expanded_resource["module"] = module_config["name"]
             
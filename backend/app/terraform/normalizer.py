@@ -3,8 +3,7 @@ Resource normalizer.
 Converts Terraform resources to canonical format.
 """
 import logging
-from typing import Dict, List, Optional
-from copy import deepcopy
+from typing import Callable, Dict, List, Optional
 
 from app.config import settings
 
@@ -39,6 +38,14 @@ class ResourceNormalizer:
     
     def __init__(self):
         self.warnings = []
+        # Per-type attribute normalizers, built once so dispatch is O(1)
+        self._attribute_normalizers: Dict[str, Callable[[Dict], Dict]] = {
+            "aws_instance": self._normalize_instance_attributes,
+            "aws_ebs_volume": self._normalize_ebs_volume_attributes,
+            "aws_db_instance": self._normalize_db_instance_attributes,
+            "aws_s3_bucket": self._normalize_s3_bucket_attributes,
+            "aws_lambda_function": self._normalize_lambda_function_attributes,
+        }
     
     def expand_count(self, resource: Dict) -> List[Dict]:
         """
@@ -75,12 +82,14 @@ class ResourceNormalizer:
         # Create copies
         expanded = []
         for i in range(count_int):
-            resource_copy = deepcopy(resource)
+            # Only top-level keys differ between copies
+            resource_copy = dict(resource)
             resource_copy["name"] = f"{resource['name']}[{i}]"
             resource_copy["count_index"] = i
             expanded.append(resource_copy)
         
-        logger.info(f"Expanded count={count_int} for {resource['name']}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Expanded count={count_int} for {resource['name']}")
         return expanded
     
     def expand_for_each(self, resource: Dict) -> List[Dict]:
@@ -120,13 +129,15 @@ class ResourceNormalizer:
         # Create copies
         expanded = []
         for key, value in items:
-            resource_copy = deepcopy(resource)
+            # Only top-level keys differ between copies
+            resource_copy = dict(resource)
             resource_copy["name"] = f"{resource['name']}[{key}]"
             resource_copy["for_each_key"] = key
             resource_copy["for_each_value"] = value
             expanded.append(resource_copy)
         
-        logger.info(f"Expanded for_each with {len(items)} items for {resource['name']}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Expanded for_each with {len(items)} items for {resource['name']}")
         return expanded
     
     def normalize_resource(self, resource: Dict) -> Optional[Dict]:
@@ -141,12 +152,15 @@ class ResourceNormalizer:
         """
         resource_type = resource.get("type")
         
-        if resource_type not in self.RESOURCE_TYPE_MAP:
+        # One probe yields both fields (vs. membership test, index, and two
+        # nested lookups)
+        try:
+            service, canonical_type = _RESOURCE_TYPE_FIELDS[resource_type]
+        except KeyError:
             logger.warning(f"Unsupported resource type: {resource_type}")
             self.warnings.append(f"Unsupported resource type: {resource_type}")
             return None
         
-        mapping = self.RESOURCE_TYPE_MAP[resource_type]
         attributes = resource.get("attributes", {})
         
         # Extract region (may be in provider or resource)
@@ -158,8 +172,8 @@ class ResourceNormalizer:
         # Build normalized resource
         normalized = {
             "provider": "aws",
-            "service": mapping["service"],
-            "type": mapping["type"],
+            "service": service,
+            "type": canonical_type,
             "resource_type": resource_type,
             "name": resource.get("name"),
             "region": region,
@@ -172,6 +186,10 @@ class ResourceNormalizer:
         """
         Normalize resource attributes based on type.
         
+        Dispatches through the per-type table built in __init__ so each
+        resource costs a single dict lookup instead of walking an if/elif
+        chain of string comparisons.
+        
         Args:
             resource_type: Terraform resource type
             attributes: Raw attributes
@@ -179,54 +197,61 @@ class ResourceNormalizer:
         Returns:
             Normalized attributes
         """
-        # Type-specific normalization
-        if resource_type == "aws_instance":
-            # CRITICAL: Don't infer OS - require explicit specification
-            operating_system = attributes.get("operating_system")
-            if not operating_system:
-                # Try to get from tags or fail
-                tags = attributes.get("tags", {})
-                operating_system = tags.get("OperatingSystem") or tags.get("OS")
-            
-            return {
-                "instance_type": attributes.get("instance_type"),
-                "ami": attributes.get("ami"),
-                "tenancy": attributes.get("tenancy", "default"),
-                "operating_system": operating_system or "Linux",  # Default to Linux only as fallback
-            }
-        
-        elif resource_type == "aws_ebs_volume":
-            return {
-                "volume_type": attributes.get("type", "gp2"),
-                "size": attributes.get("size", 100),
-                "iops": attributes.get("iops", 0),
-            }
-        
-        elif resource_type == "aws_db_instance":
-            return {
-                "instance_class": attributes.get("instance_class"),
-                "engine": attributes.get("engine", "mysql"),
-                "allocated_storage": attributes.get("allocated_storage", 20),
-                "storage_type": attributes.get("storage_type", "gp2"),
-                "deployment_option": "Multi-AZ" if attributes.get("multi_az") else "Single-AZ",
-            }
-        
-        elif resource_type == "aws_s3_bucket":
-            return {
-                "storage_class": attributes.get("storage_class", "STANDARD"),
-                "estimated_storage_gb": attributes.get("estimated_storage_gb", 100),
-                "estimated_requests": attributes.get("estimated_requests", 10000),
-            }
-        
-        elif resource_type == "aws_lambda_function":
-            return {
-                "memory_size": attributes.get("memory_size", 128),
-                "estimated_invocations": attributes.get("estimated_invocations", 100000),
-                "estimated_duration_ms": attributes.get("estimated_duration_ms", 1000),
-            }
-        
-        # Default: return all attributes
-        return attributes
+        handler = self._attribute_normalizers.get(resource_type)
+        if handler is None:
+            # Default: return all attributes
+            return attributes
+        return handler(attributes)
+    
+    def _normalize_instance_attributes(self, attributes: Dict) -> Dict:
+        """Normalize aws_instance attributes."""
+        # CRITICAL: Don't infer OS - require explicit specification
+        operating_system = attributes.get("operating_system")
+        if not operating_system:
+            # Try to get from tags or fail
+            tags = attributes.get("tags", {})
+            operating_system = tags.get("OperatingSystem") or tags.get("OS")
+        
+        return {
+            "instance_type": attributes.get("instance_type"),
+            "ami": attributes.get("ami"),
+            "tenancy": attributes.get("tenancy", "default"),
+            "operating_system": operating_system or "Linux",  # Default to Linux only as fallback
+        }
+    
+    def _normalize_ebs_volume_attributes(self, attributes: Dict) -> Dict:
+        """Normalize aws_ebs_volume attributes."""
+        return {
+            "volume_type": attributes.get("type", "gp2"),
+            "size": attributes.get("size", 100),
+            "iops": attributes.get("iops", 0),
+        }
+    
+    def _normalize_db_instance_attributes(self, attributes: Dict) -> Dict:
+        """Normalize aws_db_instance attributes."""
+        return {
+            "instance_class": attributes.get("instance_class"),
+            "engine": attributes.get("engine", "mysql"),
+            "allocated_storage": attributes.get("allocated_storage", 20),
+            "storage_type": attributes.get("storage_type", "gp2"),
+            "deployment_option": "Multi-AZ" if attributes.get("multi_az") else "Single-AZ",
+        }
+    
+    def _normalize_s3_bucket_attributes(self, attributes: Dict) -> Dict:
+        """Normalize aws_s3_bucket attributes."""
+        return {
+            "storage_class": attributes.get("storage_class", "STANDARD"),
+            "estimated_storage_gb": attributes.get("estimated_storage_gb", 100),
+            "estimated_requests": attributes.get("estimated_requests", 10000),
+        }
+    
+    def _normalize_lambda_function_attributes(self, attributes: Dict) -> Dict:
+        """Normalize aws_lambda_function attributes."""
+        return {
+            "memory_size": attributes.get("memory_size", 128),
+            "estimated_invocations": attributes.get("estimated_invocations", 100000),
+            "estimated_duration_ms": attributes.get("estimated_duration_ms", 1000),
+        }
     
     def infer_os_from_ami(self, ami: str) -> str:
         """
@@ -278,3 +303,11 @@ class ResourceNormalizer:
         
         logger.info(f"Normalized {len(normalized)} resources from {len(resources)} raw resources")
         return normalized
+
+
+# Flattened RESOURCE_TYPE_MAP: resource type -> (service, canonical type).
+# The nested map stays the readable source of truth and for introspection.
+_RESOURCE_TYPE_FIELDS = {
+    resource_type: (mapping["service"], mapping["type"])
+    for resource_type, mapping in ResourceNormalizer.RESOURCE_TYPE_MAP.items()
+}
@@ -3,13 +3,32 @@ Terraform HCL parser.
 Parses .tf files using python-hcl2.
 """
 import logging
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import hcl2
-import json
 
 logger = logging.getLogger(__name__)
 
+# Parsed HCL keyed by resolved path, stored with the (mtime_ns, size) stamp
+# it was parsed from. python-hcl2 is a pure Python parser and by far the
+# slowest pipeline stage; the same module directory is re-parsed for every
+# module block that references it, and re-analysis of an unchanged upload
+# re-parses every file. Keying by path alone means a rewritten file replaces
+# its stale entry instead of leaving it to age out of the LRU.
+PARSE_CACHE_SIZE = 256
+_parse_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()  # evaluations run in worker threads
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached HCL parse results."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
 
 class TerraformParseError(Exception):
     """Raised when Terraform parsing fails."""
@@ -39,14 +58,37 @@ class TerraformParser:
             Parsed HCL as dictionary
         """
         try:
+            # A rewritten file changes mtime or size, so stale entries never match
+            stat = file_path.stat()
+            cache_key = str(file_path.resolve())
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = None
+            with _parse_cache_lock:
+                entry = _parse_cache.get(cache_key)
+                if entry is not None and entry[0] == stamp:
+                    cached = entry[1]
+                    _parse_cache.move_to_end(cache_key)
+            
+            if cached is not None:
+                logger.debug(f"Parse cache hit for {file_path}")
+                # CRITICAL: callers mutate parsed blocks; never hand out the cached tree
+                return deepcopy(cached)
+            
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             # Parse HCL
             parsed = hcl2.loads(content)
             
+            with _parse_cache_lock:
+                _parse_cache[cache_key] = (stamp, parsed)
+                _parse_cache.move_to_end(cache_key)
+                if len(_parse_cache) > PARSE_CACHE_SIZE:
+                    _parse_cache.popitem(last=False)
+            
             logger.info(f"Parsed {file_path}")
-            return parsed
+            return deepcopy(parsed)
         
         except Exception as e:
             raise TerraformParseError(f"Failed to parse {file_path}: {e}")
@@ -61,7 +103,13 @@ class TerraformParser:
         Returns:
             Combined parsed HCL
         """
-        tf_files = list(directory.glob("*.tf"))
+        # scandir yields d_type with each entry, so regular files are
+        # recognised without a stat syscall per directory entry
+        with os.scandir(directory) as entries:
+            tf_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".tf") and entry.is_file()
+            )
         
         if not tf_files:
             raise TerraformParseError(f"No .tf files found in {directory}")
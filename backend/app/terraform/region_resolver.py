@@ -8,6 +8,9 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# AZ format: region + letter (e.g., us-east-1a)
+AZ_PATTERN = re.compile(r'^([a-z]{2}-[a-z]+-\d+)[a-z]$')
+
 
 class RegionResolutionError(Exception):
     """Raised when region cannot be determined."""
@@ -120,8 +123,7 @@ class RegionResolver:
         Returns:
             Region code or None if invalid
         """
-        # AZ format: region + letter (e.g., us-east-1a)
-        match = re.match(r'^([a-z]{2}-[a-z]+-\d+)[a-z]$', availability_zone)
+        match = AZ_PATTERN.match(availability_zone)
         if match:
             region = match.group(1)
             if region in self.VALID_REGIONS:
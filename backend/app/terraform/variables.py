@@ -4,11 +4,15 @@ Resolves variable references and applies defaults.
 """
 import logging
 import re
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional
 from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
+# Matches ${local.name} references (used to build the locals dependency graph)
+LOCAL_REFERENCE_PATTERN = re.compile(r'\$\{local\.([a-zA-Z0-9_]+)\}')
+
 
 class VariableResolver:
     """
@@ -63,13 +67,62 @@ class VariableResolver:
             if isinstance(local_value, (str, int, float, bool, list, dict)):
                 self.resolved_locals[local_name] = local_value
         
-        # Second pass: resolve references
-        for local_name, local_value in self.locals.items():
+        # Second pass: resolve references in dependency order so a local
+        # referencing another local sees that local's resolved value
+        for local_name in self._local_resolution_order():
+            local_value = self.locals[local_name]
             if isinstance(local_value, str):
                 self.resolved_locals[local_name] = self.resolve_string_references(local_value)
         
         return self.resolved_locals
     
+    def _local_resolution_order(self) -> List[str]:
+        """
+        Order locals so dependencies are resolved before dependents.
+        
+        Uses Kahn's algorithm over integer indices (in-degree array plus
+        adjacency lists) rather than dict-keyed DFS. Locals that are part
+        of a reference cycle are appended in declaration order.
+        
+        Returns:
+            Local names in resolution order
+        """
+        names = list(self.locals)
+        index = {name: i for i, name in enumerate(names)}
+        in_degree = [0] * len(names)
+        dependents: List[List[int]] = [[] for _ in names]
+        
+        for i, name in enumerate(names):
+            value = self.locals[name]
+            if not isinstance(value, str):
+                continue
+            
+            for dep_name in set(LOCAL_REFERENCE_PATTERN.findall(value)):
+                j = index.get(dep_name)
+                if j is not None and j != i:
+                    in_degree[i] += 1
+                    dependents[j].append(i)
+        
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order = []
+        
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for k in dependents[i]:
+                in_degree[k] -= 1
+                if in_degree[k] == 0:
+                    queue.append(k)
+        
+        if len(order) < len(names):
+            cyclic = [i for i, degree in enumerate(in_degree) if degree > 0]
+            logger.warning(
+                f"Circular local references: {', '.join(names[i] for i in cyclic)}"
+            )
+            order.extend(cyclic)
+        
+        return [names[i] for i in order]
+    
     def resolve_string_references(self, value: str) -> Any:
         """
         Resolve variable and local references in a string.
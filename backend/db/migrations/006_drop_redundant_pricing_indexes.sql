@@ -0,0 +1,44 @@
+-- Drop secondary indexes on service pricing tables that duplicate the
+-- uq_pricing_* unique constraints (see 005).
+-- Every bulk insert during normalization maintains every index, so each
+-- redundant B-tree is pure write overhead on ingest.
+--
+-- Only indexes whose columns are a leading prefix of (or identical to) a
+-- unique constraint are dropped; the constraint's index serves the same
+-- lookups, ON CONFLICT targets and ON DELETE CASCADE scans.
+
+-- EC2: (version_id) is a prefix of uq_pricing_ec2_sku
+-- (version_id, instance_type, operating_system, tenancy, region, capacity_status).
+-- idx_pricing_ec2_lookup (version_id, instance_type, region) is NOT a prefix
+-- (region comes after operating_system and tenancy) and is kept.
+DROP INDEX IF EXISTS idx_pricing_ec2_version;
+
+-- RDS: idx_pricing_rds_lookup is kept. uq_pricing_rds_sku in 005 names a
+-- column (engine) that pricing_rds does not have, so that constraint may be
+-- missing and the lookup index can be the only one on the table.
+
+-- S3: idx_pricing_s3_lookup (version_id, storage_class, region) is NOT a
+-- prefix of uq_pricing_s3_sku (version_id, storage_class, volume_type, region)
+-- and is kept.
+
+-- EBS / Lambda: lookup index is identical to the unique constraint
+DROP INDEX IF EXISTS idx_pricing_ebs_lookup;
+DROP INDEX IF EXISTS idx_pricing_lambda_lookup;
+
+-- Verify
+DO $$
+DECLARE
+    index_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO index_count
+    FROM pg_indexes
+    WHERE indexname IN (
+        'idx_pricing_ec2_version', 'idx_pricing_ebs_lookup', 'idx_pricing_lambda_lookup'
+    );
+
+    IF index_count = 0 THEN
+        RAISE NOTICE 'SUCCESS: Redundant pricing indexes dropped';
+    ELSE
+        RAISE WARNING '% redundant pricing indexes remain', index_count;
+    END IF;
+END $$;
@@ -0,0 +1,27 @@
+-- Compress pricing_dimensions.attributes with lz4 instead of the default pglz.
+-- Every SKU stores its full AWS attribute blob, and each ingest writes a new
+-- version's worth of them; lz4 compresses and decompresses several times
+-- faster than pglz at a similar ratio, cutting CPU on bulk ingest and on
+-- reads of attribute-heavy rows.
+--
+-- Applies to newly written values only; existing versions keep pglz until
+-- they are rewritten or archived.
+
+ALTER TABLE pricing_dimensions ALTER COLUMN attributes SET COMPRESSION lz4;
+
+-- Verify
+DO $$
+DECLARE
+    compression CHAR;
+BEGIN
+    SELECT attcompression INTO compression
+    FROM pg_attribute
+    WHERE attrelid = 'pricing_dimensions'::regclass
+      AND attname = 'attributes';
+    
+    IF compression = 'l' THEN
+        RAISE NOTICE 'SUCCESS: pricing_dimensions.attributes uses lz4 compression';
+    ELSE
+        RAISE WARNING 'pricing_dimensions.attributes compression is %', compression;
+    END IF;
+END $$;
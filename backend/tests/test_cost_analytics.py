@@ -413,3 +413,34 @@ class TestCostAggregator:
         assert analytics.total_monthly_cost == Decimal("0")
         assert analytics.total_supported_resources == 1
         assert len(analytics.unsupported_resources) == 0
+
+
+class TestStatusDictAggregator:
+    """Test the dict-based aggregator used by the analysis API."""
+    
+    def test_aggregate_all_matches_individual_aggregations(self):
+        """Test single-pass aggregate_all agrees with the per-metric methods."""
+        from app.engine.aggregator import CostAggregator as DictCostAggregator
+        
+        results = [
+            {"status": "SUPPORTED", "service_code": "AmazonEC2", "region": "us-east-1",
+             "resource_type": "aws_instance", "monthly_cost": 10.0, "warnings": ["w1"]},
+            {"status": "UNSUPPORTED", "resource_name": "vpc", "warnings": ["w1", "w2"],
+             "unsupported_reason": "No adapter"},
+            {"status": "ERROR", "resource_name": "db", "error_message": "boom"},
+            {"status": "SUPPORTED", "service_code": "AmazonS3", "region": "us-east-1",
+             "resource_type": "aws_s3_bucket", "monthly_cost": 2.5}
+        ]
+        
+        aggregator = DictCostAggregator(results)
+        result = aggregator.aggregate_all()
+        
+        assert result["total_monthly_cost"] == aggregator.get_total_cost()
+        assert result["breakdown_by_service"] == aggregator.aggregate_by_service()
+        assert result["breakdown_by_region"] == aggregator.aggregate_by_region()
+        assert result["breakdown_by_type"] == aggregator.aggregate_by_resource_type()
+        assert result["resource_counts"] == aggregator.get_resource_counts()
+        assert result["coverage_percentage"] == aggregator.get_coverage_percentage()
+        assert result["warnings"] == aggregator.collect_warnings()
+        assert result["errors"] == aggregator.collect_errors()
+        assert result["unsupported"] == aggregator.collect_unsupported()
@@ -0,0 +1,241 @@
+"""
+Tests for normalized async pricing adapters against the real table schema.
+"""
+import re
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+from sqlalchemy import create_engine, text
+
+from app.engine.async_calculator import AsyncCostCalculator
+from app.models.usage_model import UsageModel
+from app.pricing.async_adapters.base import (
+    AsyncPricingAdapter,
+    NormalizedPrefetchMixin,
+    clear_pricing_rule_cache
+)
+from app.pricing.async_adapters.ebs_normalized import AsyncEBSAdapterNormalized
+from app.pricing.async_adapters.ec2_normalized import AsyncEC2AdapterNormalized
+from app.pricing.async_adapters.rds_normalized import AsyncRDSAdapterNormalized
+
+
+MIGRATION_PATH = Path(__file__).parent.parent / "db" / "migrations" / "003_service_pricing_tables.sql"
+
+
+def create_pricing_table(conn, table):
+    """Create a normalized pricing table from its migration DDL."""
+    ddl = re.search(
+        rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\n\);",
+        MIGRATION_PATH.read_text(),
+        re.DOTALL
+    ).group(0)
+    conn.execute(text(ddl))
+
+
+@pytest.fixture
+def pricing_conn():
+    """Sync in-memory connection; adapters await its execute via AsyncMock."""
+    engine = create_engine("sqlite:///:memory:")
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def empty_pricing_rule_cache():
+    """Keep the process-wide pricing rule cache isolated per test."""
+    clear_pricing_rule_cache()
+    yield
+    clear_pricing_rule_cache()
+
+
+def db_for(conn):
+    """Async session stand-in that runs statements on a real connection."""
+    db = Mock()
+    db.execute = AsyncMock(side_effect=lambda statement, params=None: conn.execute(statement, params))
+    db.begin_nested = Mock(return_value=AsyncMock())
+    return db
+
+
+class TestNormalizedAdapterSchema:
+    """Test adapter queries use the migration's column names."""
+    
+    @pytest.mark.asyncio
+    async def test_rds_prefetch_and_match_use_table_columns(self, pricing_conn):
+        """Test RDS prefetch and match_pricing run against pricing_rds."""
+        create_pricing_table(pricing_conn, "pricing_rds")
+        pricing_conn.execute(text("""
+            INSERT INTO pricing_rds
+                (id, version_id, sku, instance_class, database_engine,
+                 deployment_option, region, price_per_unit, unit, currency)
+            VALUES
+                (1, 42, 'SKU1', 'db.t3.micro', 'MySQL', 'Single-AZ', 'us-east-1', 0.017, 'Hrs', 'USD'),
+                (2, 42, 'SKU2', 'db.t3.micro', 'MySQL', 'Multi-AZ', 'us-east-1', 0.034, 'Hrs', 'USD')
+        """))
+        
+        db = db_for(pricing_conn)
+        resource = {"instance_class": "db.t3.micro", "engine": "MySQL", "region": "us-east-1"}
+        
+        adapter = AsyncRDSAdapterNormalized(db, Mock(id=42))
+        await adapter.prefetch_pricing([resource])
+        rule = await adapter.match_pricing(resource)
+        
+        assert rule.id == 1
+        assert db.execute.await_count == 1
+        
+        # Uncached path queries the same columns
+        clear_pricing_rule_cache()
+        multi_az = dict(resource, deployment_option="Multi-AZ")
+        rule = await AsyncRDSAdapterNormalized(db, Mock(id=42)).match_pricing(multi_az)
+        
+        assert rule.id == 2
+    
+    @pytest.mark.asyncio
+    async def test_ec2_prefetch_and_match_use_table_columns(self, pricing_conn):
+        """Test EC2 prefetch and match_pricing run against pricing_ec2."""
+        create_pricing_table(pricing_conn, "pricing_ec2")
+        pricing_conn.execute(text("""
+            INSERT INTO pricing_ec2
+                (id, version_id, sku, instance_type, operating_system, tenancy,
+                 capacity_status, region, price_per_unit, unit, currency)
+            VALUES
+                (1, 42, 'SKU1', 't3.micro', 'Linux', 'Shared', 'Used', 'us-east-1', 0.0104, 'Hrs', 'USD')
+        """))
+        
+        db = db_for(pricing_conn)
+        resource = {"instance_type": "t3.micro", "region": "us-east-1"}
+        
+        adapter = AsyncEC2AdapterNormalized(db, Mock(id=42))
+        await adapter.prefetch_pricing([resource])
+        rule = await adapter.match_pricing(resource)
+        
+        assert rule.id == 1
+        assert db.execute.await_count == 1
+        
+        clear_pricing_rule_cache()
+        rule = await AsyncEC2AdapterNormalized(db, Mock(id=42)).match_pricing(resource)
+        
+        assert rule.id == 1
+    
+    def test_prefetch_adapter_must_build_pricing_params(self):
+        """Test a prefetching adapter without _pricing_params cannot be created."""
+        class NoParamsAdapter(NormalizedPrefetchMixin, AsyncPricingAdapter):
+            required_attributes = ["region"]
+            supported_regions = ["us-east-1"]
+            service_code = "Test"
+            
+            def validate(self, resource):
+                pass
+            
+            async def match_pricing(self, resource):
+                return None
+            
+            def calculate(self, resource, pricing_rule):
+                return None
+        
+        with pytest.raises(TypeError, match="_pricing_params"):
+            NoParamsAdapter(Mock(), Mock(id=42))
+
+
+class TestPricingRuleCache:
+    """Test the process-wide pricing rule cache."""
+    
+    @pytest.mark.asyncio
+    async def test_pricing_rule_cache_shared_across_adapters(self):
+        """Test matched pricing rules are reused by new adapter instances."""
+        row = Mock(id=1, sku="SKU1", price_per_unit="0.08", unit="GB-Mo", currency="USD")
+        result = Mock()
+        result.fetchone.return_value = row
+        db = Mock()
+        db.execute = AsyncMock(return_value=result)
+        version = Mock(id=42)
+        resource = {"volume_type": "gp3", "region": "us-east-1"}
+        
+        # Two adapters, as created by two separate requests
+        rule1 = await AsyncEBSAdapterNormalized(db, version).match_pricing(resource)
+        rule2 = await AsyncEBSAdapterNormalized(db, version).match_pricing(resource)
+        
+        assert rule1 is rule2
+        assert db.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_ec2_prefetch_fills_pricing_rule_cache(self):
+        """Test one prefetch query serves later EC2 matches from the cache."""
+        row = Mock(
+            id=1, sku="SKU1", price_per_unit="0.0104", unit="Hrs", currency="USD",
+            instance_type="t3.micro", region="us-east-1",
+            operating_system="Linux", tenancy="Shared", capacity_status="Used"
+        )
+        db = Mock()
+        db.execute = AsyncMock(return_value=[row])
+        adapter = AsyncEC2AdapterNormalized(db, Mock(id=42))
+        resource = {"instance_type": "t3.micro", "region": "us-east-1"}
+        
+        # Duplicate and invalid resources share / skip the single query
+        await adapter.prefetch_pricing([resource, dict(resource), {"region": "us-east-1"}])
+        rule = await adapter.match_pricing(resource)
+        
+        assert rule.id == 1
+        assert db.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_rds_prefetch_keeps_only_requested_rows(self):
+        """Test over-selected prefetch rows are not cached."""
+        def rds_row(row_id, deployment_option):
+            return Mock(
+                id=row_id, sku=f"SKU{row_id}", price_per_unit="0.017", unit="Hrs",
+                currency="USD", instance_class="db.t3.micro", database_engine="MySQL",
+                region="us-east-1", deployment_option=deployment_option
+            )
+        
+        db = Mock()
+        db.execute = AsyncMock(return_value=[rds_row(1, "Multi-AZ"), rds_row(2, "Single-AZ")])
+        adapter = AsyncRDSAdapterNormalized(db, Mock(id=42))
+        resource = {"instance_class": "db.t3.micro", "engine": "MySQL", "region": "us-east-1"}
+        
+        await adapter.prefetch_pricing([resource])
+        rule = await adapter.match_pricing(resource)
+        
+        # Single-AZ is the default deployment option
+        assert rule.id == 2
+        assert db.execute.await_count == 1
+
+
+class TestAsyncCostCalculatorPrefetch:
+    """Test prefetch failures degrade to per-resource matching."""
+    
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_falls_back_to_per_resource_matching(self, pricing_conn):
+        """Test one failing batch does not fail every resource."""
+        # pricing_rds is missing, so its prefetch query fails
+        create_pricing_table(pricing_conn, "pricing_ec2")
+        pricing_conn.execute(text("""
+            INSERT INTO pricing_ec2
+                (id, version_id, sku, instance_type, operating_system, tenancy,
+                 capacity_status, region, price_per_unit, unit, currency)
+            VALUES
+                (1, 42, 'SKU1', 't3.small', 'Linux', 'Shared', 'Used', 'us-east-1', 0.0208, 'Hrs', 'USD')
+        """))
+        
+        resources = [
+            {
+                "name": "web", "service": "AmazonEC2", "region": "us-east-1",
+                "attributes": {
+                    "instance_type": "t3.small", "region": "us-east-1",
+                    "usage_model": UsageModel()
+                }
+            },
+            {
+                "name": "db", "service": "AmazonRDS", "region": "us-east-1",
+                "attributes": {
+                    "instance_class": "db.t3.micro", "engine": "MySQL",
+                    "region": "us-east-1", "usage_model": UsageModel()
+                }
+            }
+        ]
+        
+        calculator = AsyncCostCalculator(db_for(pricing_conn), Mock(id=42))
+        results = await calculator.calculate_all_costs(resources)
+        
+        assert [r["status"] for r in results] == ["SUPPORTED", "ERROR"]
+        assert results[0]["pricing_rule_id"] == 1
@@ -4,7 +4,8 @@ Validates that adapters cannot silently fail.
 """
 import pytest
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
+from sqlalchemy.dialects import postgresql
 
 from app.pricing.adapters.base import (
     PricingAdapter,
@@ -18,6 +19,7 @@ from app.pricing.adapters.base import (
     UnitMismatchError
 )
 from app.pricing.adapters.ec2_strict import StrictEC2Adapter
+from app.pricing.async_adapters.ec2 import AsyncEC2Adapter
 
 
 class TestCostResult:
@@ -228,6 +230,25 @@ class TestStrictEC2Adapter:
         assert rule.id == 123
         assert rule.price_per_unit == Decimal("0.0116")
     
+    def test_match_pricing_query_uses_model_columns(self):
+        """Test the match query filters through the service and region tables."""
+        resource = {
+            "instance_type": "t3.micro",
+            "region": "us-east-1"
+        }
+        
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = None
+        self.db.execute.return_value = mock_result
+        
+        with pytest.raises(PricingMatchError):
+            self.adapter.match_pricing(resource)
+        
+        query = str(self.db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN pricing_services ON pricing_dimensions.service_id = pricing_services.id" in query
+        assert "JOIN pricing_regions ON pricing_dimensions.region_id = pricing_regions.id" in query
+        assert "pricing_dimensions.attributes @>" in query
+    
     def test_calculate_unit_mismatch_fails(self):
         """Test that unit mismatch causes error."""
         resource = {
@@ -347,3 +368,29 @@ class TestAdapterContractEnforcement:
         
         with pytest.raises(CalculationError, match="must return CostResult"):
             adapter.calculate_cost({})
+
+
+class TestAsyncEC2Adapter:
+    """Test the async EC2 adapter's pricing dimension query."""
+    
+    @pytest.mark.asyncio
+    async def test_match_pricing_query_uses_model_columns(self):
+        """Test the match query filters through the service and region tables."""
+        dimension = Mock(
+            id=123, price_per_unit=Decimal("0.0116"), unit="Hrs",
+            currency="USD", attributes={"instanceType": "t3.micro"}
+        )
+        result = Mock()
+        result.scalar_one_or_none.return_value = dimension
+        db = Mock()
+        db.execute = AsyncMock(return_value=result)
+        adapter = AsyncEC2Adapter(db, Mock(id=1))
+        
+        rule = await adapter.match_pricing({"instance_type": "t3.micro", "region": "us-east-1"})
+        
+        query = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN pricing_services ON pricing_dimensions.service_id = pricing_services.id" in query
+        assert "JOIN pricing_regions ON pricing_dimensions.region_id = pricing_regions.id" in query
+        assert "pricing_dimensions.attributes @>" in query
+        assert rule.service_code == "AmazonEC2"
+        assert rule.region_code == "us-east-1"
@@ -0,0 +1,81 @@
+"""
+Tests for pricing normalization storage transactions.
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.pricing.normalization import base
+from app.pricing.normalization.base import BasePricingNormalizer
+
+
+class FlakyNormalizer(BasePricingNormalizer):
+    """Normalizer whose storage fails on a chosen batch."""
+    
+    def __init__(self, db, version_id, fail_on_batch=None):
+        super().__init__(db, version_id)
+        self.fail_on_batch = fail_on_batch
+        self.stored_batches = 0
+    
+    @property
+    def service_code(self):
+        return "Test"
+    
+    @property
+    def required_attributes(self):
+        return ["region"]
+    
+    async def normalize_product(self, product):
+        return {"sku": product["sku"], "region": "us-east-1"}
+    
+    async def store_normalized_data(self, normalized_products):
+        self.stored_batches += 1
+        if self.stored_batches == self.fail_on_batch:
+            raise RuntimeError("connection lost")
+        return len(normalized_products)
+
+
+def products(count):
+    """(sku, product) pairs with one OnDemand price each."""
+    return [(f"SKU{i}", {"sku": f"SKU{i}"}) for i in range(count)]
+
+
+def priced(sku):
+    return {"price_per_unit": "0.1", "unit": "Hrs", "currency": "USD"}
+
+
+@pytest.fixture
+def db():
+    session = Mock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+class TestNormalizationTransaction:
+    """Test a file is stored all-or-nothing."""
+    
+    @pytest.mark.asyncio
+    async def test_batches_commit_once(self, db, monkeypatch):
+        """Test every batch is stored before a single commit."""
+        monkeypatch.setattr(base, "NORMALIZE_BATCH_SIZE", 2)
+        normalizer = FlakyNormalizer(db, version_id=1)
+        
+        count = await normalizer._normalize_products(products(5), priced)
+        
+        assert count == 5
+        assert normalizer.stored_batches == 3
+        assert db.commit.await_count == 1
+        db.rollback.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_rolls_back_whole_file(self, db, monkeypatch):
+        """Test a failure part-way through leaves no committed rows."""
+        monkeypatch.setattr(base, "NORMALIZE_BATCH_SIZE", 2)
+        normalizer = FlakyNormalizer(db, version_id=1, fail_on_batch=2)
+        
+        with pytest.raises(RuntimeError, match="connection lost"):
+            await normalizer._normalize_products(products(5), priced)
+        
+        db.commit.assert_not_awaited()
+        db.rollback.assert_awaited_once()
@@ -2,8 +2,10 @@
 Unit tests for pricing version state management.
 Validates state transitions and single active version constraint.
 """
+import asyncio
 import pytest
 from datetime import datetime
+from unittest.mock import AsyncMock, Mock
 from sqlalchemy.exc import IntegrityError
 
 from app.pricing.version_manager import (
@@ -11,7 +13,9 @@ from app.pricing.version_manager import (
     VersionStatus,
     VersionTransitionError,
     ValidationIncompleteError,
-    MultipleActiveVersionsError
+    MultipleActiveVersionsError,
+    clear_active_version_cache,
+    get_cached_active_version
 )
 from app.models.models import PricingVersion, PricingDimension
 
@@ -265,6 +269,66 @@ class TestVersionLifecycle:
         assert all("created_at" in h for h in history)
 
 
+class TestActiveVersionCache:
+    """Test the shared ACTIVE version lookup used by analysis requests."""
+    
+    def setup_method(self):
+        clear_active_version_cache()
+    
+    def teardown_method(self):
+        clear_active_version_cache()
+    
+    @staticmethod
+    def async_db(*versions):
+        """Async session stand-in returning each version from successive queries."""
+        results = []
+        for version in versions:
+            result = Mock()
+            result.scalar_one_or_none.return_value = version
+            results.append(result)
+        
+        async def execute(statement):
+            # Yield so concurrent lookups queue up on the lock
+            await asyncio.sleep(0)
+            return results.pop(0)
+        
+        db = Mock()
+        db.execute = AsyncMock(side_effect=execute)
+        return db
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self):
+        """Test concurrent requests on a cold cache issue one version query."""
+        version = Mock(id=42)
+        db = self.async_db(version)
+        
+        versions = await asyncio.gather(*[get_cached_active_version(db) for _ in range(10)])
+        
+        assert all(v is version for v in versions)
+        assert db.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_activation_invalidates_cached_version(self):
+        """Test activating a version is visible to the next lookup."""
+        old_version, new_version = Mock(id=1), Mock(id=2)
+        db = self.async_db(old_version, new_version)
+        
+        assert await get_cached_active_version(db) is old_version
+        
+        # Sync session: _get_version finds the VALIDATED version, then the
+        # current ACTIVE version is looked up for archiving
+        to_activate = Mock(id=2, status=VersionStatus.VALIDATED, validated_at=datetime.utcnow())
+        sync_db = Mock()
+        sync_db.execute.side_effect = [
+            Mock(**{"scalar_one_or_none.return_value": to_activate}),
+            Mock(**{"scalar_one_or_none.return_value": None})
+        ]
+        PricingVersionManager(sync_db).activate_version(2, "admin")
+        
+        assert await get_cached_active_version(db) is new_version
+        assert db.execute.await_count == 2
+
+
 # Fixtures for testing
 @pytest.fixture
 def db_session():
@@ -282,3 +346,23 @@ def db_session():
     yield session
     
     session.close()
+
+
+class TestValidationCounts:
+    """Test validation counts query the pricing_dimensions columns."""
+    
+    def test_validate_counts_distinct_services(self):
+        """Test the service count uses service_id and the counts drive validation."""
+        draft = Mock(id=1, status=VersionStatus.DRAFT)
+        db = Mock()
+        db.execute.side_effect = [
+            Mock(**{"scalar_one_or_none.return_value": draft}),
+            Mock(**{"one.return_value": (150, 2)})
+        ]
+        
+        validated = PricingVersionManager(db).validate_version(1, "system")
+        
+        counts_query = str(db.execute.call_args_list[1].args[0])
+        assert "count(distinct(pricing_dimensions.service_id))" in counts_query
+        assert validated.status == VersionStatus.VALIDATED
+        assert validated.validation_errors is None
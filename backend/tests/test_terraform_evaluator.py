@@ -9,6 +9,7 @@ from app.terraform.evaluator.expression_eval import ExpressionEvaluator
 from app.terraform.evaluator.count_expander import CountExpander
 from app.terraform.evaluator.foreach_expander import ForEachExpander
 from app.terraform.evaluator.conditional_eval import ConditionalEvaluator
+from app.terraform.variables import VariableResolver
 from app.terraform.evaluator.errors import (
     UnresolvedReferenceError,
     InvalidExpressionError,
@@ -134,6 +135,34 @@ class TestExpressionEvaluator:
         
         with pytest.raises(DynamicValueError):
             evaluator.evaluate("${resource.aws_instance.web.id}")
+    
+    def test_expression_results_memoized(self):
+        """Test repeated expressions reuse the cached result until cleared."""
+        evaluator = ExpressionEvaluator(
+            variables={"size": 10},
+            locals_dict={}
+        )
+        
+        assert evaluator.evaluate("${max(var.size, 5)}") == 10
+        
+        # Cached: variables are fixed for an evaluator's lifetime
+        evaluator.variables["size"] = 50
+        assert evaluator.evaluate("${max(var.size, 5)}") == 10
+        
+        evaluator.clear_cache()
+        assert evaluator.evaluate("${max(var.size, 5)}") == 50
+    
+    def test_mutable_results_not_shared(self):
+        """Test list results are rebuilt rather than served from the cache."""
+        evaluator = ExpressionEvaluator(
+            variables={"a": ["x"], "b": ["y"]},
+            locals_dict={}
+        )
+        
+        first = evaluator.evaluate("${concat(var.a, var.b)}")
+        first.append("z")
+        
+        assert evaluator.evaluate("${concat(var.a, var.b)}") == ["x", "y"]
 
 
 class TestCountExpander:
@@ -206,6 +235,23 @@ class TestCountExpander:
         assert result[1]["attributes"]["name"] == "server-1"
         assert result[2]["attributes"]["name"] == "server-2"
     
+    def test_count_leaves_source_resource_intact(self):
+        """Test expansion copies instead of mutating the source resource."""
+        evaluator = ExpressionEvaluator(variables={"count": 2}, locals_dict={})
+        expander = CountExpander(evaluator)
+        
+        resource = {
+            "name": "web",
+            "type": "aws_instance",
+            "attributes": {"count": "${var.count}", "instance_type": "t3.micro"}
+        }
+        
+        result = expander.expand(resource)
+        assert "count" in resource["attributes"]
+        assert "logical_id" not in resource
+        assert "count" not in result[0]["attributes"]
+        assert result[0]["attributes"] is not result[1]["attributes"]
+    
     def test_count_limit_exceeded(self):
         """Test expansion limit is enforced."""
         evaluator = ExpressionEvaluator(variables={"count": 2000}, locals_dict={})
@@ -332,6 +378,31 @@ class TestForEachExpander:
         assert prod["attributes"]["name"] == "server-prod"
         assert prod["attributes"]["size"] == "large"
     
+    def test_foreach_nested_and_unreferenced_attributes(self):
+        """Test each.* in nested blocks resolves and other values pass through."""
+        evaluator = ExpressionEvaluator(
+            variables={"envs": {"prod": "large", "dev": "small"}},
+            locals_dict={}
+        )
+        expander = ForEachExpander(evaluator)
+        
+        resource = {
+            "name": "web",
+            "type": "aws_instance",
+            "attributes": {
+                "for_each": "${var.envs}",
+                "instance_type": "t3.micro",
+                "tags": {"Env": "${each.key}"}
+            }
+        }
+        
+        result = expander.expand(resource)
+        prod = next(r for r in result if r["for_each_key"] == "prod")
+        assert prod["attributes"]["tags"] == {"Env": "prod"}
+        assert prod["attributes"]["instance_type"] == "t3.micro"
+        assert "for_each" not in prod["attributes"]
+        assert "for_each" in resource["attributes"]
+    
     def test_foreach_limit_exceeded(self):
         """Test expansion limit is enforced."""
         large_map = {f"item{i}": i for i in range(2000)}
@@ -412,6 +483,25 @@ class TestConditionalEvaluator:
         assert result["size"] == "xlarge"
 
 
+class TestVariableResolver:
+    """Test variable and local resolution."""
+    
+    def test_locals_resolved_in_dependency_order(self):
+        """Test a local can reference a local declared after it."""
+        resolver = VariableResolver(
+            {"env": {"default": "prod"}},
+            {
+                "full_name": "${local.prefix}-app",
+                "prefix": "${var.env}-web"
+            }
+        )
+        
+        resolved = resolver.resolve_all()
+        
+        assert resolved["locals"]["prefix"] == "prod-web"
+        assert resolved["locals"]["full_name"] == "prod-web-app"
+
+
 class TestIntegration:
     """Integration tests for complete evaluation pipeline."""
     